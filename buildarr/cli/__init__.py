@@ -21,12 +21,84 @@ from __future__ import annotations
 
 import os
 
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 import click
 
 from ..logging import setup_logger
 
+if TYPE_CHECKING:
+    from typing import Any, List, Mapping, Optional
+
+
+class LazyGroup(click.Group):
+    """
+    Click command group that defers importing built-in commands until they are used.
+
+    Importing every command module up front pulls in the configuration, manager and
+    state modules (and their dependencies) on every invocation, even when only
+    a single command is run. Instead, commands listed in `lazy_commands` are imported
+    from their module the first time they are looked up.
+
+    The command module is expected to register the command on this group
+    when imported (e.g. using the `@cli.command` decorator).
+
+    Installed plugins are also only loaded (and their commands added to this group)
+    when a command that is not built-in is looked up, or all commands are listed,
+    so running a built-in command (or showing its help) does not import
+    every installed plugin. Built-in commands that use plugins load them
+    by calling `load_plugins` when they run.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        lazy_commands: Optional[Mapping[str, str]] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = dict(lazy_commands) if lazy_commands else {}
+        self.plugins_loaded = False
+
+    def load_plugins(self) -> None:
+        """
+        Load all installed plugins, and add their commands to this group.
+
+        Plugins are only loaded once, subsequent calls do nothing.
+        """
+        if self.plugins_loaded:
+            return
+        from ..plugins import load as load_plugins
+        from ..state import state
+
+        load_plugins()
+        for plugin_name, plugin in state.plugins.items():
+            if plugin.cli is not None:
+                self.add_command(plugin.cli, name=plugin_name)
+        self.plugins_loaded = True
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        self.load_plugins()
+        return sorted({*super().list_commands(ctx), *self.lazy_commands.keys()})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name not in self.commands:
+            if cmd_name in self.lazy_commands:
+                import_module(self.lazy_commands[cmd_name])
+            else:
+                self.load_plugins()
+        return super().get_command(ctx, cmd_name)
+
 
 @click.group(
+    cls=LazyGroup,
+    lazy_commands={
+        "compose": "buildarr.cli.compose",
+        "daemon": "buildarr.cli.daemon",
+        "run": "buildarr.cli.run",
+        "test-config": "buildarr.cli.test_config",
+    },
     help=(
         "Construct and configure Arr PVR stacks.\n\n"
         "Can be run as a daemon or as an ad-hoc command.\n\n"
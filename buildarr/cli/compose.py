@@ -18,23 +18,20 @@
 
 from __future__ import annotations
 
+import re
 import sys
 
-from ipaddress import ip_address
-from logging import getLogger
+from logging import DEBUG, getLogger
 from pathlib import Path
 from textwrap import indent
 from typing import TYPE_CHECKING, cast
 
 import click
-import yaml
 
 from .. import __version__
-from ..config import load_config, load_instance_configs, resolve_instance_dependencies
 from ..logging import get_log_level
-from ..manager import load_managers
 from ..state import state
-from ..util import get_resolved_path, windows_to_posix
+from ..util import get_resolved_path, windows_to_posix, yaml_safe_dump
 from . import cli
 from .exceptions import (
     ComposeInvalidHostnameError,
@@ -46,9 +43,25 @@ from .exceptions import (
 if TYPE_CHECKING:
     from typing import Any, Dict, List, Set
 
+    from ..state import PluginInstanceRef
+
 
 logger = getLogger(__name__)
 
+# Strings that could possibly be IPv4 or IPv6 addresses (including IPv6 scope IDs).
+# Used to avoid parsing the vast majority of hostnames as IP addresses.
+IP_ADDRESS_CANDIDATE = re.compile(r"[0-9A-Fa-f:.]+(%.+)?")
+
+# Volume sources containing a path separator are bind mounts, otherwise they are named volumes.
+PATH_SEPARATOR = re.compile(r"[/\\]")
+
+# Volume paths need to be converted to POSIX paths when running on Windows.
+IS_WINDOWS = sys.platform == "win32"
+
+# Sizes of tuple volume definitions without and with the options element.
+VOLUME_TUPLE_SIZE = 2
+VOLUME_TUPLE_WITH_OPTIONS_SIZE = 3
+
 
 @cli.command(
     help=(
@@ -119,12 +132,23 @@ logger = getLogger(__name__)
         "Note that the hostnames will no longer match the Buildarr configuration file."
     ),
 )
+@click.option(
+    "--cache/--no-cache",
+    "use_cache",
+    default=False,
+    help=(
+        "Cache the parsed configuration files in the Buildarr cache directory, "
+        "and reuse the cache until the configuration files are modified. "
+        "Disabled by default."
+    ),
+)
 def compose(
     config_path: Path,
     use_plugins: Set[str],
     compose_version: str,
     compose_restart: str,
     ignore_hostnames: bool,
+    use_cache: bool,
 ) -> None:
     """
     `buildarr compose` main routine.
@@ -132,42 +156,60 @@ def compose(
     Args:
         config_path (Path): Configuration file to load.
         use_plugins (Set[str]): Plugins to load. If empty, use all plugins.
+        use_cache (bool): Cache parsed configuration files.
     """
 
+    # Import the configuration and manager modules (and their dependencies)
+    # only when a Docker Compose file is actually being generated,
+    # to avoid slowing down CLI startup.
+    from ipaddress import ip_address
+
+    from ..config import load_config, load_instance_configs, resolve_instance_dependencies
+    from ..manager import load_managers
+
+    cli.load_plugins()
+
     logger.debug("Buildarr version %s (log level: %s)", __version__, get_log_level())
-    plugin_strs = [f"{pn} ({state.plugins[pn].version})" for pn in sorted(state.plugins.keys())]
-    logger.debug(
-        "Loaded plugins: %s",
-        ", ".join(plugin_strs) if plugin_strs else "(no plugins found)",
-    )
+    if logger.isEnabledFor(DEBUG):
+        plugin_strs = [f"{pn} ({state.plugins[pn].version})" for pn in sorted(state.plugins.keys())]
+        logger.debug(
+            "Loaded plugins: %s",
+            ", ".join(plugin_strs) if plugin_strs else "(no plugins found)",
+        )
     logger.debug(
         "Creating Docker Compose file from configuration file: %s",
         str(config_path),
     )
 
     logger.debug("Loading configuration file '%s'", config_path)
-    load_config(path=config_path, use_plugins=use_plugins)
+    load_config(path=config_path, use_plugins=use_plugins, use_cache=use_cache)
     logger.debug("Finished loading configuration file")
-    logger.debug("Buildarr configuration:")
-    for config_line in state.config.model_dump_yaml(exclude_unset=True).splitlines():
-        logger.debug(indent(config_line, "  "))
+    # Only serialise the configuration for the debug log if it will actually be output.
+    if logger.isEnabledFor(DEBUG):
+        logger.debug("Buildarr configuration:")
+        for config_line in state.config.model_dump_yaml(exclude_unset=True).splitlines():
+            logger.debug("  %s", config_line)
 
     logger.debug("Loading plugin managers")
     load_managers(use_plugins)
     logger.debug("Finished loading plugin managers")
-    logger.debug("Managers loaded for the following plugins:")
-    for plugin_name in state.managers.keys():
-        logger.debug("  - %s", plugin_name)
+    if logger.isEnabledFor(DEBUG):
+        logger.debug("Managers loaded for the following plugins:")
+        for plugin_name in state.managers.keys():
+            logger.debug("  - %s", plugin_name)
 
     logger.debug("Loading instance configurations")
     load_instance_configs(use_plugins)
     logger.debug("Finished loading instance configurations")
-    for plugin_name, instance_configs in state.instance_configs.items():
-        for instance_name, instance_config in instance_configs.items():
-            with state._with_context(plugin_name=plugin_name, instance_name=instance_name):
-                logger.debug("Instance configuration:")
-                for config_line in instance_config.model_dump_yaml(exclude_unset=True).splitlines():
-                    logger.debug(indent(config_line, "  "))
+    if logger.isEnabledFor(DEBUG):
+        for plugin_name, instance_configs in state.instance_configs.items():
+            for instance_name, instance_config in instance_configs.items():
+                with state._with_context(plugin_name=plugin_name, instance_name=instance_name):
+                    logger.debug("Instance configuration:")
+                    for config_line in instance_config.model_dump_yaml(
+                        exclude_unset=True,
+                    ).splitlines():
+                        logger.debug("  %s", config_line)
 
     if not state.active_plugins:
         raise ComposeNoPluginsDefinedError("No loaded plugins configured in Buildarr")
@@ -175,49 +217,68 @@ def compose(
     logger.debug("Resolving instance dependencies")
     resolve_instance_dependencies()
     logger.debug("Finished resolving instance dependencies")
-    logger.debug("Execution order:")
-    for i, (plugin_name, instance_name) in enumerate(state._execution_order, 1):
-        logger.debug("  %i. %s.instances[%s]", i, plugin_name, repr(instance_name))
+    if logger.isEnabledFor(DEBUG):
+        logger.debug("Execution order:")
+        for i, (plugin_name, instance_name) in enumerate(state._execution_order, 1):
+            logger.debug("  %i. %s.instances[%s]", i, plugin_name, repr(instance_name))
 
-    compose_obj: Dict[str, Any] = {"version": compose_version, "services": {}}
-    used_hostnames: Dict[str, Dict[str, str]] = {}
-    volumes: Set[str] = set()
+    # Generate the service names for all instances up front, so they can be reused
+    # when generating service dependencies.
+    service_names: Dict[PluginInstanceRef, str] = {
+        (plugin_name, instance_name): f"{plugin_name}_{instance_name}"
+        for plugin_name, instance_name in state._execution_order
+    }
+    # Serialise and output each service as soon as it has been generated,
+    # so the full Docker Compose file is never held in memory at once.
+    # If an error occurs, the command exits with an error after the services
+    # generated so far have been output.
+    click.echo(yaml_safe_dump({"version": compose_version}, explicit_start=True), nl=False)
+    click.echo("services:")
+    used_hostnames: Dict[str, PluginInstanceRef] = {}
+    # Use a dictionary as an insertion-ordered set, so named volumes are always
+    # output in the order they were first defined.
+    volumes: Dict[str, None] = {}
 
     for plugin_name, instance_name in state._execution_order:
         manager = state.managers[plugin_name]
         instance_config = state.instance_configs[plugin_name][instance_name]
         with state._with_context(plugin_name=plugin_name, instance_name=instance_name):
-            service_name = f"{plugin_name}_{instance_name}"
+            service_name = service_names[(plugin_name, instance_name)]
             logger.debug("Generating Docker Compose configuration for service '%s'", service_name)
             hostname = cast(
                 str,
                 service_name.replace("_", "-") if ignore_hostnames else instance_config.hostname,
             )
             logger.debug("Validating service hostname '%s'", hostname)
-            try:
-                ip_address(hostname)  # type: ignore[arg-type]
-                raise ComposeInvalidHostnameError(
-                    f"Invalid hostname '{hostname}' for {plugin_name} instance '{instance_name}': "
-                    "Expected hostname, got IP address",
-                )
-            except ValueError:
-                pass
+            if IP_ADDRESS_CANDIDATE.fullmatch(hostname):
+                try:
+                    ip_address(hostname)
+                    raise ComposeInvalidHostnameError(
+                        (
+                            f"Invalid hostname '{hostname}' for "
+                            f"{plugin_name} instance '{instance_name}': "
+                            "Expected hostname, got IP address"
+                        ),
+                    )
+                except ValueError:
+                    pass
             if hostname == "localhost":
                 raise ComposeInvalidHostnameError(
                     f"Invalid hostname '{hostname}' for {plugin_name} instance '{instance_name}': "
                     "Hostname must not be localhost for Docker Compose services",
                 )
-            if hostname in used_hostnames:
-                used_by = used_hostnames[hostname]
+            # Register the hostname and check whether it was already in use
+            # in a single dictionary operation.
+            plugin_instance = (plugin_name, instance_name)
+            used_by = used_hostnames.setdefault(hostname, plugin_instance)
+            if used_by is not plugin_instance:
                 raise ComposeInvalidHostnameError(
                     (
                         f"Invalid hostname '{hostname}' for "
                         f"{plugin_name} instance '{instance_name}': "
-                        "Hostname already used by "
-                        f"{used_by['plugin_name']} instance '{used_by['instance_name']}'"
+                        f"Hostname already used by {used_by[0]} instance '{used_by[1]}'"
                     ),
                 )
-            used_hostnames[hostname] = {"plugin_name": plugin_name, "instance_name": instance_name}
             logger.debug("Finished validating service hostname")
             logger.debug("Generating service-specific configuration")
             try:
@@ -237,9 +298,7 @@ def compose(
                 if isinstance(service_config["volumes"], dict):
                     service_config["volumes"] = [
                         {
-                            "type": (
-                                "volume" if "/" not in source and "\\" not in source else "bind"
-                            ),
+                            "type": "bind" if PATH_SEPARATOR.search(source) else "volume",
                             "source": source,
                             "target": target,
                         }
@@ -251,29 +310,34 @@ def compose(
                     new_volumes: List[Dict[str, Any]] = []
                     for volume in service_config["volumes"]:
                         if isinstance(volume, tuple):
-                            try:
+                            volume_size = len(volume)
+                            if volume_size == VOLUME_TUPLE_WITH_OPTIONS_SIZE:
                                 source, target, options = volume
-                            except ValueError:
-                                try:
-                                    source, target = volume
-                                    options = []
-                                except ValueError:
-                                    raise ComposeInvalidVolumeDefinitionError(
-                                        (
-                                            "Invalid tuple volume definition for "
-                                            f"{plugin_name} instance '{instance_name}' "
-                                            "(expecting a 2-tuple, or 3-tuple): "
-                                            f"{volume}"
-                                        ),
-                                    ) from None
-                            options_set = set(opt.strip().lower() for opt in options)
+                            elif volume_size == VOLUME_TUPLE_SIZE:
+                                source, target = volume
+                                options = ()
+                            else:
+                                raise ComposeInvalidVolumeDefinitionError(
+                                    (
+                                        "Invalid tuple volume definition for "
+                                        f"{plugin_name} instance '{instance_name}' "
+                                        "(expecting a 2-tuple, or 3-tuple): "
+                                        f"{volume}"
+                                    ),
+                                )
+                            read_only = False
+                            read_write = False
+                            for opt in options:
+                                option = opt.strip().lower()
+                                if option == "ro":
+                                    read_only = True
+                                elif option == "rw":
+                                    read_write = True
                             new_volume = {
-                                "type": (
-                                    "volume" if "/" not in source and "\\" not in source else "bind"
-                                ),
+                                "type": "bind" if PATH_SEPARATOR.search(source) else "volume",
                                 "source": source,
                                 "target": target,
-                                "read_only": "ro" in options_set and "rw" not in options_set,
+                                "read_only": read_only and not read_write,
                             }
                             if new_volume["type"] == "bind":
                                 new_volume["bind"] = {"create_host_path": True}
@@ -281,73 +345,86 @@ def compose(
                         else:
                             new_volumes.append(volume)
                     service_config["volumes"] = new_volumes
-                # If we are running on Windows, convert the source and target
-                # fields to POSIX paths, as required.
-                if sys.platform == "win32":
-                    for volume in service_config["volumes"]:
-                        for key in ("source", "target"):
-                            volume[key] = windows_to_posix(volume[key])
+                # Finalise the volumes and collect named volumes in a single pass.
+                for volume in service_config["volumes"]:
+                    # If we are running on Windows, convert the source and target
+                    # fields to POSIX paths, as required.
+                    if IS_WINDOWS:
+                        volume["source"] = windows_to_posix(volume["source"])
+                        volume["target"] = windows_to_posix(volume["target"])
+                    if volume["type"] == "volume":
+                        logger.debug(
+                            "Adding named volume '%s' to the list of internal volumes",
+                            volume["source"],
+                        )
+                        volumes[volume["source"]] = None
+                    else:
+                        logger.debug(
+                            (
+                                "Volume '%s:%s' is a bind mount, "
+                                "not adding to the list of internal volumes"
+                            ),
+                            volume["source"],
+                            volume["target"],
+                        )
             service: Dict[str, Any] = {
                 **service_config,
                 "hostname": hostname,
                 "restart": compose_restart,
             }
             logger.debug("Finished generating service-specific configuration")
-            if (plugin_name, instance_name) in state._instance_dependencies:
-                depends_on: Set[str] = set()
+            # Use `get` to avoid adding empty entries to the `defaultdict`.
+            target_plugin_instances = state._instance_dependencies.get(
+                (plugin_name, instance_name),
+            )
+            if target_plugin_instances:
                 logger.debug("Generating service dependencies")
-                for target_plugin, target_instance in state._instance_dependencies[
-                    (plugin_name, instance_name)
-                ]:
-                    target_service = f"{target_plugin}_{target_instance}"
-                    logger.debug("Adding dependency to service '%s'", target_service)
-                    depends_on.add(target_service)
-                service["depends_on"] = list(depends_on)
+                # Sort the service dependencies to make the output deterministic.
+                service["depends_on"] = sorted(
+                    {
+                        service_names[target_plugin_instance]
+                        for target_plugin_instance in target_plugin_instances
+                    },
+                )
                 logger.debug("Finished generating service dependencies")
-            for volume in service.get("volumes", []):
-                if volume["type"] == "volume":
-                    logger.debug(
-                        "Adding named volume '%s' to the list of internal volumes",
-                        volume["source"],
-                    )
-                    volumes.add(volume["source"])
-                else:
-                    logger.debug(
-                        (
-                            "Volume '%s:%s' is a bind mount, "
-                            "not adding to the list of internal volumes"
-                        ),
-                        volume["source"],
-                        volume["target"],
-                    )
-            compose_obj["services"][service_name] = service
+            click.echo(_dump_service(service_name, service), nl=False)
             logger.debug("Finished generating Docker Compose service configuration")
 
     logger.debug("Generating Docker Compose configuration for service 'buildarr'")
-    compose_obj["services"]["buildarr"] = {
+    config_file = state.config_files[0]
+    config_dir = config_file.parent
+    buildarr_service: Dict[str, Any] = {
         "image": f"{state.config.buildarr.docker_image_uri}:{__version__}",
-        "command": ["daemon", f"/config/{state.config_files[0].name}"],
+        "command": ["daemon", f"/config/{config_file.name}"],
         "volumes": [
             {
                 "type": "bind",
-                "source": (
-                    windows_to_posix(state.config_files[0].parent)
-                    if sys.platform == "win32"
-                    else str(state.config_files[0].parent)
-                ),
+                "source": (windows_to_posix(config_dir) if IS_WINDOWS else str(config_dir)),
                 "target": "/config",
                 "read_only": True,
             },
         ],
         "restart": compose_restart,
-        "depends_on": [
-            f"{plugin_name}_{instance_name}"
-            for plugin_name, instance_name in state._execution_order
-        ],
+        "depends_on": list(service_names.values()),
     }
+    click.echo(_dump_service("buildarr", buildarr_service), nl=False)
     logger.debug("Finished generating Docker Compose configuration for service 'buildarr'")
 
     if volumes:
-        compose_obj["volumes"] = list(volumes)
+        click.echo(yaml_safe_dump({"volumes": list(volumes)}), nl=False)
+
+
+def _dump_service(service_name: str, service: Dict[str, Any]) -> str:
+    """
+    Serialise a Docker Compose service definition into YAML,
+    indented for placement under the top-level `services` key.
+
+    Args:
+        service_name (str): Name of the service.
+        service (Dict[str, Any]): Docker Compose service definition.
+
+    Returns:
+        Indented YAML string for the service
+    """
 
-    click.echo(yaml.safe_dump(compose_obj, explicit_start=True, sort_keys=False), nl=False)
+    return indent(yaml_safe_dump({service_name: service}, sort_keys=False), "  ")
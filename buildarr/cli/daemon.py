@@ -18,22 +18,33 @@
 
 from __future__ import annotations
 
+import hashlib
 import itertools
+import os
+import re
+import select
 import signal
+import socket
 
-from contextlib import contextmanager
-from datetime import datetime, time
-from logging import getLogger
+from collections import deque
+from contextlib import contextmanager, suppress
+from datetime import datetime, time, timedelta
+from heapq import heapify, heappop, heappush
+from logging import DEBUG, INFO, getLogger
 from pathlib import Path
-from threading import Lock, current_thread
-from time import sleep
-from typing import TYPE_CHECKING, cast
+from threading import Lock, Timer, current_thread
+from typing import TYPE_CHECKING, TypeVar
 
 import click
 
-from schedule import Job as SchedulerJob, Scheduler  # type: ignore[import]
-from watchdog.events import FileSystemEventHandler
-from watchdog.observers.polling import PollingObserver
+from watchdog.events import (
+    FileCreatedEvent,
+    FileModifiedEvent,
+    FileMovedEvent,
+    FileSystemEventHandler,
+)
+from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserverVFS
 
 from .. import __version__
 from ..config import load_config
@@ -46,13 +57,53 @@ from .run import _run as run_apply
 
 if TYPE_CHECKING:
     from types import FrameType
-    from typing import Dict, Generator, Iterable, List, Optional, Set, Tuple, Union
+    from typing import (
+        Deque,
+        Dict,
+        FrozenSet,
+        Generator,
+        Iterable,
+        Iterator,
+        List,
+        Optional,
+        Set,
+        Tuple,
+        Union,
+    )
 
-    from watchdog.events import DirModifiedEvent, FileModifiedEvent
+    from watchdog.events import (
+        DirCreatedEvent,
+        DirModifiedEvent,
+        FileSystemEvent,
+    )
+    from watchdog.observers.api import BaseObserver
 
 
 logger = getLogger(__name__)
 
+T = TypeVar("T")
+
+# Maximum time to wait between checks for pending update jobs (in seconds).
+SCHEDULER_MAX_IDLE_TIME = 60.0
+
+# Interval between scheduled update jobs for the same day and time.
+SCHEDULER_JOB_INTERVAL = timedelta(weeks=1)
+
+# Filesystem types that do not support native filesystem notifications,
+# so configuration files located on them need to be polled for changes.
+# FUSE filesystems (`fuse.*`) are also treated as requiring polling.
+POLLING_FILESYSTEM_TYPES = frozenset(("9p", "cifs", "nfs", "nfs4", "smb3", "smbfs"))
+
+# Octal escape sequences used for special characters in `/proc/self/mountinfo` paths.
+MOUNTINFO_ESCAPE = re.compile(r"\\([0-7]{3})")
+
+# Time to wait for the config file observer thread to exit when stopping it (in seconds).
+OBSERVER_STOP_TIMEOUT = 2.0
+
+# Time to wait for further config file events before reloading the configuration (in seconds).
+# Editors can generate several events when saving a file, which should only cause one reload.
+WATCH_CONFIG_RELOAD_DELAY = 0.5
+
 
 class Daemon:
     """
@@ -68,6 +119,7 @@ class Daemon:
         watch_config: Optional[bool],
         update_days: Iterable[DayOfWeek],
         update_times: Iterable[time],
+        watch_interval: Optional[float] = None,
     ) -> None:
         """
         Initialise the daemon object.
@@ -80,25 +132,51 @@ class Daemon:
             watch_config (Optional[bool]): Override `watch_config` setting
             update_days (Iterable[DayOfWeek]): Override `update_days` setting
             update_times (Iterable[time]): Override `update_times` setting
+            watch_interval (Optional[float]): Override `watch_config_interval` setting
         """
         # Set static configuration and override field values.
         self.config_path = config_path
         self.default_watch_config = watch_config
-        self.default_update_days = set(update_days)
-        self.default_update_times = set(update_times)
+        # Update days and times are sorted here so that it is not repeated on every reload.
+        self.default_update_days = tuple(sorted(set(update_days))) or None
+        self.default_update_times = tuple(sorted(set(update_times))) or None
+        self.default_watch_interval = watch_interval
         # Internal variables for tracking daemon state.
         self._stopped = False
+        # Socket pair used to wake up the main loop when a signal is received,
+        # the daemon is stopped, or the update job schedule has changed.
+        # A socket pair is used instead of a pipe as `select` only supports sockets on Windows.
+        self._wakeup_recv, self._wakeup_send = socket.socketpair()
+        self._wakeup_recv.setblocking(False)
+        self._wakeup_send.setblocking(False)
+        # Signals received by the signal handlers, to be handled by the main loop.
+        self._received_signals: Deque[int] = deque()
         self._lock = Lock()
         self._watch_config = False
-        self._update_days: Set[DayOfWeek] = set()
-        self._update_times: Set[time] = set()
-        self._update_daytimes: List[Tuple[DayOfWeek, time]] = []
+        self._watch_config_polling = False
+        self._watch_config_interval = 0.0
+        self._update_days: Tuple[DayOfWeek, ...] = ()
+        self._update_times: Tuple[time, ...] = ()
+        self._update_daytimes: Tuple[Tuple[DayOfWeek, time, str], ...] = ()
         self._old_watch_config = False
-        self._old_update_days: Set[DayOfWeek] = set()
-        self._old_update_times: Set[time] = set()
-        self._old_update_daytimes: List[Tuple[DayOfWeek, time]] = []
-        self._observer = PollingObserver()
-        self._scheduler = Scheduler()
+        self._old_watch_config_polling = False
+        self._old_watch_config_interval = 0.0
+        self._old_update_days: Tuple[DayOfWeek, ...] = ()
+        self._old_update_times: Tuple[time, ...] = ()
+        self._old_update_daytimes: Tuple[Tuple[DayOfWeek, time, str], ...] = ()
+        self._observer: Optional[BaseObserver] = None
+        self._observer_polling = False
+        self._observer_interval = 0.0
+        self._watched_config_dirs: Dict[Path, Set[str]] = {}
+        self._watched_config_paths: FrozenSet[str] = frozenset()
+        self._config_fingerprints: Dict[Path, Tuple[int, int, bytes]] = {}
+        self._reload_lock = Lock()
+        self._reload_timer: Optional[Timer] = None
+        self._reload_changes: Set[Tuple[str, str]] = set()
+        self._reload_pending = False
+        # Update job schedule, stored as a heap of next run times,
+        # so the main loop only needs to check the earliest job.
+        self._update_schedule: List[Tuple[datetime, DayOfWeek, time]] = []
 
     def start(self) -> None:
         """
@@ -111,39 +189,90 @@ class Daemon:
             logger.info("Buildarr ready.")
         # Enter the update job schedule main loop.
         # This is a non-blocking process, so if there are no jobs to run,
-        # it returns and sleeps for a pre-determined amount of time.
+        # it returns and sleeps until the next job is due.
+        # The main loop is woken up early if a signal has been received,
+        # the daemon has been signaled to stop, or the update job schedule has changed.
         # If the daemon has been signaled to stop, exit the loop.
-        run_once = False
         while not self._stopped:
-            if run_once:
-                sleep(1)
-            self._scheduler.run_pending()
-            run_once = True
+            self._run_pending()
+            update_schedule = self._update_schedule
+            readable, _, _ = select.select(
+                [self._wakeup_recv],
+                [],
+                [],
+                (
+                    max(
+                        0.0,
+                        min(
+                            (update_schedule[0][0] - datetime.now()).total_seconds(),
+                            SCHEDULER_MAX_IDLE_TIME,
+                        ),
+                    )
+                    if update_schedule
+                    else SCHEDULER_MAX_IDLE_TIME
+                ),
+            )
+            if readable:
+                with suppress(BlockingIOError):
+                    while self._wakeup_recv.recv(4096):
+                        pass
+            self._handle_signals()
+        signal.set_wakeup_fd(-1)
+        self._wakeup_recv.close()
+        self._wakeup_send.close()
         logger.info("Finished stopping daemon")
 
     def stop(self) -> None:
         """
         Signal the daemon to stop, and shutdown job schedulers and monitors.
 
-        This method is called by the SIGINT and SIGHUP handlers.
+        This method is called by the main loop when `SIGINT` or `SIGTERM` is received.
         """
         logger.info("Stopping daemon")
         self._stopped = True
         self._stop_handlers()
+        self._wakeup()
+
+    def _wakeup(self) -> None:
+        """
+        Wake up the main loop, if it is waiting for the next update job.
+        """
+        # If the socket buffer is full, the main loop is already going to be woken up.
+        # If the socket has been closed, the main loop has already exited.
+        with suppress(OSError):
+            self._wakeup_send.send(b"\0")
 
     @contextmanager
-    def _run_lock(self) -> Generator[None, None, None]:
+    def _run_lock(self, blocking: bool = True) -> Generator[bool, None, None]:
         """
         Control Buildarr run jobs using a lock, ensuring only one job runs at a given time.
+
+        Args:
+            blocking (bool, optional): Wait for the lock if it is held. Defaults to `True`.
+
+        Yields:
+            `True` if the lock was acquired, otherwise `False` (when not blocking)
         """
         thread = current_thread()
-        self._lock.acquire()
+        if not self._lock.acquire(blocking=blocking):
+            logger.debug("Thread '%s' unable to acquire daemon run lock", thread.name)
+            yield False
+            return
         try:
             logger.debug("Thread '%s' acquired daemon run lock", thread.name)
-            yield
+            yield True
         finally:
             logger.debug("Thread '%s' releasing daemon run lock", thread.name)
-            self._lock.release()
+            # If a config reload was deferred while this job was running, start it now.
+            # The lock is released while holding the reload lock, so a reload
+            # cannot be deferred after the pending flag has been checked.
+            with self._reload_lock:
+                self._lock.release()
+                reload_pending = self._reload_pending
+                self._reload_pending = False
+            if reload_pending:
+                logger.debug("Starting deferred config reload")
+                self._schedule_watch_config_reload()
 
     def _load_config(self) -> None:
         """
@@ -154,37 +283,48 @@ class Daemon:
         logger.info("Loading configuration file '%s'", self.config_path)
         load_config(self.config_path)
         logger.info("Finished loading configuration file")
+        self._config_fingerprints = self._get_config_fingerprints(self._config_fingerprints)
         # Fetch the new configuration values, from the command line overrides,
         # then the Buildarr configuration, in that order.
         buildarr_config = state.config.buildarr
-        watch_config = (
-            self.default_watch_config
-            if self.default_watch_config is not None
-            else buildarr_config.watch_config
-        )
-        update_days = (
-            self.default_update_days if self.default_update_days else buildarr_config.update_days
-        )
-        update_times = (
-            self.default_update_times if self.default_update_times else buildarr_config.update_times
+        watch_config = get_override(self.default_watch_config, buildarr_config.watch_config)
+        watch_config_interval = get_override(
+            self.default_watch_interval,
+            buildarr_config.watch_config_interval,
         )
+        update_days = self.default_update_days or tuple(sorted(buildarr_config.update_days))
+        update_times = self.default_update_times or tuple(sorted(buildarr_config.update_times))
         # Record whether or not the values were updated.
         self._old_watch_config = self._watch_config
+        self._old_watch_config_polling = self._watch_config_polling
+        self._old_watch_config_interval = self._watch_config_interval
         self._old_update_days = self._update_days
         self._old_update_times = self._update_times
         self._old_update_daytimes = self._update_daytimes
         # Set the new values.
         self._watch_config = watch_config
+        self._watch_config_polling = buildarr_config.watch_config_polling
+        self._watch_config_interval = watch_config_interval
         self._update_days = update_days
         self._update_times = update_times
-        # Generate the update job schedule.
-        self._update_daytimes = [
-            (update_day, update_time)
-            for update_day, update_time in itertools.product(
-                sorted(self._update_days),
-                sorted(self._update_times),
+        # Generate the update job schedule, if the update days or times have changed.
+        # The human-readable form of each update day and time is also generated here,
+        # so it does not need to be formatted every time the schedule is logged.
+        if (
+            not self._update_daytimes
+            or self._update_days != self._old_update_days
+            or self._update_times != self._old_update_times
+        ):
+            update_time_strs = [
+                (update_time, update_time.strftime("%H:%M")) for update_time in self._update_times
+            ]
+            self._update_daytimes = tuple(
+                (update_day, update_time, f"{update_day.name.capitalize()} {update_time_str}")
+                for update_day, (update_time, update_time_str) in itertools.product(
+                    self._update_days,
+                    update_time_strs,
+                )
             )
-        ]
 
     def _initial_run(self) -> None:
         """
@@ -202,8 +342,8 @@ class Daemon:
             for config_file in state.config_files:
                 logger.info("   - %s", config_file)
         logger.info(" - Update at:")
-        for update_day, update_time in self._update_daytimes:
-            logger.info("   - %s %s", update_day.name.capitalize(), update_time.strftime("%H:%M"))
+        for _, _, update_daytime_str in self._update_daytimes:
+            logger.info("   - %s", update_daytime_str)
         # Setup update schedule.
         self._setup_update_schedule()
         # Setup configuration file watching, if enabled.
@@ -226,18 +366,40 @@ class Daemon:
         so that remote instances are automatically updated periodically.
         """
         logger.info("Scheduling update jobs")
-        self._scheduler.clear()
-        for update_day, update_time in self._update_daytimes:
-            logger.debug(
-                "Scheduling update job for %s %s",
-                update_day.name.capitalize(),
-                update_time.strftime("%H:%M"),
+        now = datetime.now()
+        update_schedule: List[Tuple[datetime, DayOfWeek, time]] = []
+        for update_day, update_time, update_daytime_str in self._update_daytimes:
+            logger.debug("Scheduling update job for %s", update_daytime_str)
+            update_schedule.append(
+                (get_next_run(update_day, update_time, now), update_day, update_time),
             )
-            cast(SchedulerJob, getattr(self._scheduler.every().week, update_day.name)).at(
-                update_time.strftime("%H:%M"),
-            ).do(self._update)
+        heapify(update_schedule)
+        # Replace the schedule in one operation, as the main loop
+        # may be reading it from another thread.
+        self._update_schedule = update_schedule
+        # Wake up the main loop, so it waits for the next job in the new schedule.
+        self._wakeup()
         logger.info("Finished scheduling update jobs")
 
+    def _run_pending(self) -> None:
+        """
+        Run a scheduled update of the remote instances, if any update jobs are due.
+
+        Due jobs are rescheduled for their next run time, and if more than one job
+        is due at once (e.g. after the system has been suspended), only one update is run.
+        """
+        update_schedule = self._update_schedule
+        now = datetime.now()
+        if not update_schedule or update_schedule[0][0] > now:
+            return
+        while update_schedule and update_schedule[0][0] <= now:
+            _, update_day, update_time = heappop(update_schedule)
+            heappush(
+                update_schedule,
+                (get_next_run(update_day, update_time, now), update_day, update_time),
+            )
+        self._update()
+
     def _update(self) -> None:
         """
         Perform a scheduled update of the remote instances.
@@ -265,35 +427,80 @@ class Daemon:
         """
         Print a log alerting the user to the next scheduled run time.
         """
-        now = datetime.now()
-        for job in sorted(self._scheduler.jobs):  # pragma: no branch
-            if not job.next_run or (job.next_run - now).total_seconds() < 0:
-                continue
+        update_schedule = self._update_schedule
+        if update_schedule:
             logger.info(
                 "The next run will be at %s",
-                job.next_run.strftime("%Y-%m-%d %H:%M"),
+                update_schedule[0][0].strftime("%Y-%m-%d %H:%M"),
             )
-            return
 
     def _setup_watch_config(self) -> None:
         """
         Start configuration watching, if enabled and the schedule has changed.
         If disabled and was previously enabled, stop configuration watching.
+
+        If configuration watching is already enabled, the existing observer is reused
+        where possible, with its event handlers replaced if the config files have changed.
         """
-        if self._watch_config == self._old_watch_config:
+        config_dirs: Dict[Path, Set[str]] = {}
+        if self._watch_config:
+            for config_file in state.config_files:
+                if config_file.parent not in config_dirs:
+                    config_dirs[config_file.parent] = set()
+                config_dirs[config_file.parent].add(config_file.name)
+        if self._watch_config == self._old_watch_config and (
+            not self._watch_config
+            or (
+                self._watch_config_polling == self._old_watch_config_polling
+                and self._watch_config_interval == self._old_watch_config_interval
+                and config_dirs == self._watched_config_dirs
+            )
+        ):
             logger.info(
                 "Config file monitoring is already %s",
                 "enabled" if self._watch_config else "disabled",
             )
             return
         if self._watch_config:
-            logger.info("Enabling config file monitoring")
-            self._observer = PollingObserver()
-            config_dirs: Dict[Path, Set[str]] = {}
-            for config_file in state.config_files:
-                if config_file.parent not in config_dirs:
-                    config_dirs[config_file.parent] = set()
-                config_dirs[config_file.parent].add(config_file.name)
+            use_polling = self._use_polling(config_dirs)
+            if self._observer and (
+                use_polling == self._observer_polling
+                and (not use_polling or self._watch_config_interval == self._observer_interval)
+            ):
+                # The monitoring method is unchanged, so only the monitored config files
+                # need to be updated on the existing observer.
+                logger.info("Updating config file monitoring")
+                self._observer.unschedule_all()
+                start_observer = False
+            else:
+                if self._observer:
+                    # The monitoring method has changed, so stop the old observer
+                    # before starting a new one.
+                    self._stop_observer()
+                logger.info(
+                    "Enabling config file monitoring (using %s)",
+                    "polling" if use_polling else "filesystem notifications",
+                )
+                self._observer = (
+                    PollingObserverVFS(
+                        stat=os.stat,
+                        listdir=self._scan_config_dir,
+                        polling_interval=self._watch_config_interval,  # type: ignore[arg-type]
+                    )
+                    if use_polling
+                    else Observer()
+                )
+                self._observer_polling = use_polling
+                self._observer_interval = self._watch_config_interval
+                start_observer = True
+            # Update the monitored config files before scheduling the event handlers,
+            # as the polling observer starts scanning the directories once they are scheduled.
+            self._watched_config_dirs = config_dirs
+            self._watched_config_paths = frozenset(
+                str(config_dir / filename)
+                for config_dir, filenames in config_dirs.items()
+                for filename in filenames
+            )
             for config_dir, filenames in config_dirs.items():
                 logger.debug(
                     "Scheduling event handler for directory '%s' with config files %s",
@@ -303,29 +510,162 @@ class Daemon:
                 self._observer.schedule(
                     ConfigDirEventHandler(self, config_dir, filenames),
                     config_dir,
+                    event_filter=list(ConfigDirEventHandler.EVENT_TYPES),
                 )
                 logger.debug("Finished scheduling event handler for directory '%s'", config_dir)
-            logger.debug("Starting config file observer")
-            self._observer.start()
-            logger.debug("Finished starting config file observer")
-            logger.info("Finished enabling config file monitoring")
+            if start_observer:
+                logger.debug("Starting config file observer")
+                self._observer.start()
+                logger.debug("Finished starting config file observer")
+                logger.info("Finished enabling config file monitoring")
+            else:
+                logger.info("Finished updating config file monitoring")
         else:
             logger.info("Disabling config file monitoring")
-            self._observer.stop()
-            self._observer = PollingObserver()
+            self._stop_observer()
             logger.info("Finished disabling config file monitoring")
 
+    def _use_polling(self, config_dirs: Iterable[Path]) -> bool:
+        """
+        Determine whether or not to poll the given directories for config file changes.
+
+        Native filesystem notifications are used by default, to avoid constantly polling
+        the configuration files for changes. Polling is used instead if forced
+        by `watch_config_polling`, or if any of the directories are on a filesystem
+        that does not support native filesystem notifications (e.g. network filesystems).
+
+        Args:
+            config_dirs (Iterable[Path]): Directories to be monitored.
+
+        Returns:
+            `True` if polling should be used, otherwise `False`
+        """
+        polling_fstypes = {
+            config_dir: fstype
+            for config_dir, fstype in (
+                (config_dir, get_filesystem_type(config_dir)) for config_dir in config_dirs
+            )
+            if fstype and requires_polling(fstype)
+        }
+        for config_dir, fstype in polling_fstypes.items():
+            logger.debug(
+                "Directory '%s' is on a %s filesystem, which requires polling",
+                config_dir,
+                fstype,
+            )
+        return self._watch_config_polling or bool(polling_fstypes)
+
+    def _scan_config_dir(self, path: Optional[str]) -> Iterator[os.DirEntry]:
+        """
+        Scan the given directory for config files, when monitoring them using polling.
+
+        Only entries for monitored config files are returned, so the polling observer
+        does not check every other file in the directory for changes on every poll.
+
+        Args:
+            path (Optional[str]): Directory to scan.
+
+        Returns:
+            Directory entries for the monitored config files
+        """
+        watched_config_paths = self._watched_config_paths
+        with os.scandir(path) as entries:
+            return iter(
+                [entry for entry in entries if entry.path in watched_config_paths],
+            )
+
+    def _stop_observer(self) -> None:
+        """
+        Stop the config file observer (if running), and wait for its thread to exit.
+
+        A new observer is only created when config file monitoring is next enabled.
+        """
+        if not self._observer:
+            return
+        self._observer.unschedule_all()
+        self._observer.stop()
+        self._observer.join(timeout=OBSERVER_STOP_TIMEOUT)
+        self._observer = None
+        self._watched_config_dirs = {}
+        self._watched_config_paths = frozenset()
+
     def _watch_config_reload(self, changed_file: str, action: str) -> None:
         """
-        Reload the Buildarr configuration, and re-run the initial run.
+        Schedule a reload of the Buildarr configuration.
 
         This method is called by the config file monitor.
+        The reload is delayed until no further config file events have been received
+        for a short time, so that a burst of events only causes a single reload.
+        """
+        # Only log the first of a burst of identical events at the default log level.
+        change = (changed_file, action)
+        with self._reload_lock:
+            repeated = change in self._reload_changes
+            self._reload_changes.add(change)
+        logger.log(
+            DEBUG if repeated else INFO,
+            "Config file '%s' has been %s",
+            changed_file,
+            action,
+        )
+        self._schedule_watch_config_reload()
+
+    def _schedule_watch_config_reload(self) -> None:
+        """
+        Schedule a configuration reload, replacing any reload that is already scheduled.
+        """
+        with self._reload_lock:
+            if self._stopped:
+                return
+            if self._reload_timer:
+                self._reload_timer.cancel()
+            self._reload_timer = Timer(WATCH_CONFIG_RELOAD_DELAY, self._watch_config_reload_run)
+            self._reload_timer.daemon = True
+            self._reload_timer.start()
+
+    def _watch_config_reload_run(self) -> None:
+        """
+        Reload the Buildarr configuration, and re-run the initial run.
+
+        This method is called by the timer scheduled by the config file monitor.
         Because this runs in a different thread, add extra handling to make sure
         that thread does not stop when an error occurs.
         """
-        with self._run_lock():
+        with self._reload_lock:
+            # Only clear the timer if another reload has not been scheduled since.
+            if self._reload_timer is current_thread():
+                self._reload_timer = None
+                self._reload_changes.clear()
+        with self._run_lock(blocking=False) as acquired:
+            # If another job is currently running, defer the reload until it has finished,
+            # instead of blocking this thread (and queueing up further reloads) in the meantime.
+            # The job holding the run lock starts the reload when it releases the lock.
+            if not acquired:
+                with self._reload_lock:
+                    # Check that the job did not finish in the meantime.
+                    reload_pending = self._lock.locked()
+                    if reload_pending:
+                        self._reload_pending = True
+                if reload_pending:
+                    logger.debug("Daemon run in progress, deferring config reload")
+                else:
+                    self._schedule_watch_config_reload()
+                return
             try:
-                logger.info("Config file '%s' has been %s", changed_file, action)
+                # Compare the contents of the config files, instead of the modification time,
+                # so files that were saved (or touched) without changes do not cause a reload.
+                old_fingerprints = self._config_fingerprints
+                old_digests = {
+                    config_file: digest for config_file, (_, _, digest) in old_fingerprints.items()
+                }
+                self._config_fingerprints = self._get_config_fingerprints(old_fingerprints)
+                new_digests = {
+                    config_file: digest
+                    for config_file, (_, _, digest) in self._config_fingerprints.items()
+                }
+                if new_digests == old_digests:
+                    logger.info("Config files are unchanged, skipping reload")
+                    return
                 logger.info("Reloading config")
                 self._initial_run()
                 logger.info("Finished reloading config")
@@ -339,6 +679,39 @@ class Daemon:
                 self._log_next_run()
                 logger.info("Buildarr ready.")
 
+    def _get_config_fingerprints(
+        self,
+        old_fingerprints: Dict[Path, Tuple[int, int, bytes]],
+    ) -> Dict[Path, Tuple[int, int, bytes]]:
+        """
+        Get the modification time, size and content digest of each loaded configuration file,
+        for determining whether or not any of them have changed since they were loaded.
+
+        Files with the same modification time and size as in the old fingerprints
+        are assumed to be unchanged, and their content digest is reused
+        instead of reading the file again.
+
+        Args:
+            old_fingerprints (Dict[Path, Tuple[int, int, bytes]]): Previous fingerprints.
+
+        Returns:
+            Modification time (in nanoseconds), size and digest for each configuration file
+        """
+        fingerprints: Dict[Path, Tuple[int, int, bytes]] = {}
+        for config_file in state.config_files:
+            try:
+                stat = config_file.stat()
+                old_fingerprint = old_fingerprints.get(config_file)
+                if old_fingerprint and old_fingerprint[:2] == (stat.st_mtime_ns, stat.st_size):
+                    digest = old_fingerprint[2]
+                else:
+                    digest = hashlib.blake2b(config_file.read_bytes()).digest()
+            except OSError:
+                # Treat files that can no longer be read as changed.
+                continue
+            fingerprints[config_file] = (stat.st_mtime_ns, stat.st_size, digest)
+        return fingerprints
+
     def _setup_signal_handlers(self) -> None:
         """
         Setup `SIGINT`, `SIGTERM` and `SIGHUP` signal handers.
@@ -346,18 +719,22 @@ class Daemon:
         SIGHUP can be used to reload the configuration, even if `watch_config` is disabled.
         """
         logger.info("Setting up signal handlers")
+        # Wake up the main loop when a signal is received, even if the signal
+        # is delivered to a thread other than the main thread.
+        logger.debug("Setting up signal wakeup file descriptor")
+        signal.set_wakeup_fd(self._wakeup_send.fileno(), warn_on_full_buffer=False)
         logger.debug("Setting up SIGINT signal handler")
-        signal.signal(signal.SIGINT, self._sigterm_handler)
+        signal.signal(signal.SIGINT, self._signal_handler)
         logger.debug("Setting up SIGTERM signal handler")
-        signal.signal(signal.SIGTERM, self._sigterm_handler)
+        signal.signal(signal.SIGTERM, self._signal_handler)
         if hasattr(signal, "SIGBREAK"):
             logger.debug("Setting up SIGBREAK signal handler")
-            signal.signal(signal.SIGBREAK, self._sigterm_handler)
+            signal.signal(signal.SIGBREAK, self._signal_handler)
         else:
             logger.debug("SIGBREAK is not available on this platform")
         if hasattr(signal, "SIGHUP"):
             logger.debug("Setting up SIGHUP signal handler")
-            signal.signal(signal.SIGHUP, self._sighup_handler)
+            signal.signal(signal.SIGHUP, self._signal_handler)
         else:
             logger.debug("SIGHUP is not available on this platform")
         logger.info("Finished setting up signal handlers")
@@ -367,30 +744,47 @@ class Daemon:
         Shutdown the config file monitors and clear the automatic update job schedule.
         """
         logger.info("Stopping config file observer")
-        self._observer.stop()
+        if self._observer:
+            self._observer.stop()
+        with self._reload_lock:
+            if self._reload_timer:
+                self._reload_timer.cancel()
+                self._reload_timer = None
+            self._reload_pending = False
         logger.info("Finished stopping config file observer")
         logger.info("Clearing update job schedule")
-        self._scheduler.clear()
+        self._update_schedule = []
         logger.info("Finished clearing update job schedule")
 
-    def _sigterm_handler(self, signalnum: int, frame: Optional[FrameType]) -> None:
+    def _signal_handler(self, signalnum: int, frame: Optional[FrameType]) -> None:
         """
-        SIGTERM/SIGINT handler callback method.
+        Signal handler callback method.
+
+        The signal is only recorded here, and handled by the main loop once it has been
+        woken up by the signal wakeup file descriptor. This avoids logging or taking locks
+        while the main thread is interrupted, which could otherwise deadlock
+        if a signal was received while a run was in progress.
         """
-        logger.info("%s received", signal.Signals(signalnum).name)
-        self.stop()
+        self._received_signals.append(signalnum)
 
-    def _sighup_handler(self, signalnum: int, frame: Optional[FrameType]) -> None:
+    def _handle_signals(self) -> None:
         """
-        SIGHUP handler callback method.
+        Handle any signals received since this method was last called.
+
+        `SIGHUP` reloads the configuration, and all other signals stop the daemon.
         """
-        logger.info("%s received", signal.Signals(signalnum).name)
-        with self._run_lock():
-            logger.info("Reloading config")
-            self._initial_run()
-            logger.info("Finished reloading config")
-            self._log_next_run()
-            logger.info("Buildarr ready.")
+        while self._received_signals and not self._stopped:
+            signalnum = self._received_signals.popleft()
+            logger.info("%s received", signal.Signals(signalnum).name)
+            if signalnum == getattr(signal, "SIGHUP", None):
+                with self._run_lock():
+                    logger.info("Reloading config")
+                    self._initial_run()
+                    logger.info("Finished reloading config")
+                    self._log_next_run()
+                    logger.info("Buildarr ready.")
+            else:
+                self.stop()
 
 
 class ConfigDirEventHandler(FileSystemEventHandler):
@@ -401,6 +795,16 @@ class ConfigDirEventHandler(FileSystemEventHandler):
     alert the Buildarr daemon.
     """
 
+    EVENT_TYPES = (FileCreatedEvent, FileModifiedEvent, FileMovedEvent)
+    """
+    Types of events the handler needs to receive.
+
+    The directory is watched instead of the config files themselves, because many editors
+    save files by writing a temporary file and renaming it over the original, which
+    replaces the inode a per-file watch would be attached to. Passing these to the observer
+    narrows the notifications requested from the operating system to just these events.
+    """
+
     def __init__(self, daemon: Daemon, config_dir: Path, filenames: Set[str]) -> None:
         """
         Initialise the config directory event handler.
@@ -410,23 +814,23 @@ class ConfigDirEventHandler(FileSystemEventHandler):
             config_dir (Path): Directory containing config files
             filenames (Set[str]): Names of config files to monitor
         """
+        super().__init__()
         self.daemon = daemon
         self.config_dir = config_dir
         self.filenames = filenames
-        super().__init__()
+        # Event paths are compared against the config file paths as strings,
+        # so filtering out events for other files is a single set lookup.
+        self._target_paths = frozenset(str(config_dir / filename) for filename in filenames)
 
-    def on_created(self, event: Union[DirModifiedEvent, FileModifiedEvent]) -> None:
+    def on_created(self, event: Union[DirCreatedEvent, FileCreatedEvent]) -> None:
         """
         On recreation of a config file within the monitored directory,
         reload the Buildarr daemon.
 
         Args:
-            event (Union[DirModifiedEvent, FileModifiedEvent]): Event metadata
+            event (Union[DirCreatedEvent, FileCreatedEvent]): Event metadata
         """
-        if not event.is_directory and Path(event.src_path) in (
-            (self.config_dir / filename) for filename in self.filenames
-        ):
-            self.daemon._watch_config_reload(event.src_path, "recreated")
+        self._reload(event, event.src_path, "recreated")
 
     def on_modified(self, event: Union[DirModifiedEvent, FileModifiedEvent]) -> None:
         """
@@ -436,10 +840,126 @@ class ConfigDirEventHandler(FileSystemEventHandler):
         Args:
             event (Union[DirModifiedEvent, FileModifiedEvent]): Event metadata
         """
-        if not event.is_directory and Path(event.src_path) in (
-            (self.config_dir / filename) for filename in self.filenames
-        ):
-            self.daemon._watch_config_reload(event.src_path, "modified")
+        self._reload(event, event.src_path, "modified")
+
+    def on_moved(self, event: FileSystemEvent) -> None:
+        """
+        On another file being renamed to a config file within the monitored directory,
+        reload the Buildarr daemon.
+
+        Renaming a config file away is not treated as a change to it.
+
+        Args:
+            event (FileSystemEvent): Event metadata
+        """
+        # Directory moves are never config file changes.
+        if isinstance(event, FileMovedEvent):
+            self._reload(event, event.dest_path, "replaced")
+
+    def _reload(self, event: FileSystemEvent, path: Union[bytes, str], action: str) -> None:
+        """
+        Reload the Buildarr daemon, if the given path is one of the monitored config files.
+
+        Args:
+            event (FileSystemEvent): Event metadata
+            path (Union[bytes, str]): Path of the file that has changed
+            action (str): Description of the change, used in logs
+        """
+        if not event.is_directory and path in self._target_paths:
+            self.daemon._watch_config_reload(os.fsdecode(path), action)
+
+
+def get_override(override: Optional[T], value: T) -> T:
+    """
+    Get the value to use for a daemon configuration field,
+    preferring the override from the command line if one was supplied.
+
+    Args:
+        override (Optional[T]): Command line override value, or `None` if not supplied.
+        value (T): Value from the Buildarr configuration.
+
+    Returns:
+        Override value if supplied, otherwise the configured value
+    """
+    return override if override is not None else value
+
+
+def get_next_run(update_day: DayOfWeek, update_time: time, now: datetime) -> datetime:
+    """
+    Get the next time an update job for the given day and time should run, after `now`.
+
+    Update times are scheduled to the minute, so seconds and time zone
+    information are ignored.
+
+    Args:
+        update_day (DayOfWeek): Day of the week to run the update job on.
+        update_time (time): Time of the day to run the update job at.
+        now (datetime): Current time.
+
+    Returns:
+        Next run time for the update job
+    """
+    next_run = datetime.combine(
+        now.date(),
+        update_time.replace(second=0, microsecond=0, tzinfo=None),
+    ) + timedelta(days=(update_day.value - now.weekday()) % 7)
+    if next_run <= now:
+        next_run += SCHEDULER_JOB_INTERVAL
+    return next_run
+
+
+def get_filesystem_type(path: Path) -> Optional[str]:
+    """
+    Get the type of the filesystem the given path is located on.
+
+    This is currently only supported on Linux, by reading `/proc/self/mountinfo`.
+
+    Args:
+        path (Path): Path to check.
+
+    Returns:
+        Filesystem type (e.g. `ext4`, `nfs4`), or `None` if it could not be determined
+    """
+    try:
+        mountinfo = Path("/proc/self/mountinfo").read_text()
+        resolved_path = path.resolve()
+    except OSError:
+        return None
+    fstype: Optional[str] = None
+    mount_point_len = -1
+    for line in mountinfo.splitlines():
+        # Format: <id> <parent id> <major:minor> <root> <mount point> <options>
+        #         [<optional fields> ...] - <fstype> <source> <super options>
+        fields, _, fs_fields = line.partition(" - ")
+        try:
+            mount_point = Path(
+                MOUNTINFO_ESCAPE.sub(lambda m: chr(int(m.group(1), 8)), fields.split()[4]),
+            )
+            mount_fstype = fs_fields.split()[0]
+        except IndexError:
+            continue
+        # Find the most specific mount point containing the path.
+        # Later mounts on the same mount point take precedence.
+        if mount_point != resolved_path and mount_point not in resolved_path.parents:
+            continue
+        if len(mount_point.parts) >= mount_point_len:
+            fstype = mount_fstype
+            mount_point_len = len(mount_point.parts)
+    return fstype
+
+
+def requires_polling(fstype: str) -> bool:
+    """
+    Return whether or not the given filesystem type requires polling to monitor for changes,
+    as it does not support native filesystem notifications.
+
+    Args:
+        fstype (str): Filesystem type.
+
+    Returns:
+        `True` if polling is required, otherwise `False`
+    """
+    return fstype in POLLING_FILESYSTEM_TYPES or fstype.startswith("fuse.")
 
 
 def parse_time(
@@ -502,6 +1022,17 @@ def parse_time(
         "Overrides the `buildarr.watch_config' config field."
     ),
 )
+@click.option(
+    "--watch-interval",
+    "watch_interval",
+    metavar="SECONDS",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help=(
+        "Interval between checks for config file changes, when polling the config files. "
+        "Overrides the `buildarr.watch_config_interval' config field."
+    ),
+)
 @click.option(
     "-d",
     "--update-day",
@@ -534,6 +1065,7 @@ def daemon(
     watch_config: Optional[bool],
     update_days: Tuple[DayOfWeek, ...],
     update_times: Tuple[time, ...],
+    watch_interval: Optional[float],
 ) -> None:
     """
     `buildarr daemon` command main routine.
@@ -543,8 +1075,11 @@ def daemon(
         watch_config (Optional[bool]): Override `watch_config` setting
         update_days (Tuple[DayOfWeek, ...]): Override `update_days` setting
         update_times (Tuple[time, ...]): Override `update_times` setting
+        watch_interval (Optional[float]): Override `watch_config_interval` setting
     """
 
+    cli.load_plugins()
+
     logger.info("Buildarr version %s (log level: %s)", __version__, get_log_level())
 
     Daemon(
@@ -552,4 +1087,5 @@ def daemon(
         watch_config=watch_config,
         update_days=update_days,
         update_times=update_times,
+        watch_interval=watch_interval,
     ).start()
@@ -20,24 +20,10 @@ Buildarr CLI main routine.
 
 from __future__ import annotations
 
-from ..plugins import load as load_plugins
-from ..state import state
 from . import cli as main
-from .compose import compose
-from .daemon import daemon
-from .run import run
-from .test_config import test_config
 
 __all__ = ["main"]
 
 
-# Load all installed plugins.
-load_plugins()
-
-# Load CLI modules for all installed plugins.
-for plugin_name, plugin in state.plugins.items():
-    if plugin.cli is not None:
-        main.add_command(plugin.cli, name=plugin_name)
-
 if __name__ == "__main__":
     main()
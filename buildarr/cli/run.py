@@ -18,10 +18,10 @@
 
 from __future__ import annotations
 
-from logging import getLogger
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from logging import DEBUG, getLogger
 from pathlib import Path
-from textwrap import indent
-from typing import Dict, Optional, Set, cast
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Set
 
 import click
 
@@ -35,13 +35,20 @@ from ..config import (
 )
 from ..logging import get_log_level
 from ..manager import load_managers
-from ..secrets import SecretsPlugin
 from ..state import state
-from ..trash import cleanup_trash_metadata, fetch_trash_metadata, trash_metadata_used
+from ..trash import cleanup_trash_metadata, fetch_trash_metadata, get_trash_metadata_instances
 from ..util import get_resolved_path
 from . import cli
 from .exceptions import RunInstanceConnectionTestFailedError, RunNoPluginsDefinedError
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor, Future
+    from typing import Any
+
+    from ..config import ConfigPlugin
+    from ..secrets import SecretsPlugin
+    from ..state import PluginInstanceRef
+
 logger = getLogger(__name__)
 
 
@@ -78,9 +85,20 @@ logger = getLogger(__name__)
         "(can be defined multiple times)"
     ),
 )
+@click.option(
+    "--cache/--no-cache",
+    "use_cache",
+    default=False,
+    help=(
+        "Cache the parsed configuration files in the Buildarr cache directory, "
+        "and reuse the cache until the configuration files are modified. "
+        "Disabled by default."
+    ),
+)
 def run(
     config_path: Path,
     use_plugins: Set[str],
+    use_cache: bool,
 ) -> None:
     """
     `buildarr run` main routine.
@@ -88,12 +106,15 @@ def run(
     Args:
         config_path (Path): Configuration file to load.
         plugins (Set[str]): Plugins to load. If empty, use all plugins.
+        use_cache (bool): Cache parsed configuration files.
     """
 
+    cli.load_plugins()
+
     logger.info("Buildarr version %s (log level: %s)", __version__, get_log_level())
 
     logger.info("Loading configuration file '%s'", config_path)
-    load_config(path=config_path, use_plugins=use_plugins)
+    load_config(path=config_path, use_plugins=use_plugins, use_cache=use_cache)
     logger.info("Finished loading configuration file")
 
     # Run the instance update main function.
@@ -115,9 +136,11 @@ def _run(use_plugins: Optional[Set[str]] = None) -> None:
         use_plugins = set()
 
     # Dump the currently active Buildarr configuration file to the debug log.
-    logger.debug("Buildarr configuration:")
-    for config_line in state.config.model_dump_yaml(exclude_unset=True).splitlines():
-        logger.debug(indent(config_line, "  "))
+    # Only serialise the configuration if it will actually be output.
+    if logger.isEnabledFor(DEBUG):
+        logger.debug("Buildarr configuration:")
+        for config_line in state.config.model_dump_yaml(exclude_unset=True).splitlines():
+            logger.debug("  %s", config_line)
 
     # Output the currently loaded plugins to the logs.
     plugin_strs = [f"{pn} ({state.plugins[pn].version})" for pn in sorted(state.plugins.keys())]
@@ -154,148 +177,339 @@ def _run(use_plugins: Optional[Set[str]] = None) -> None:
         logger.debug("  %i. %s.instances[%s]", i, plugin_name, repr(instance_name))
     logger.info("Finished resolving instance dependencies")
 
-    # Fetch TRaSH-Guides metadata, if at least one instance requires it.
-    if trash_metadata_used():
-        logger.info("Fetching TRaSH metadata")
-        fetch_trash_metadata()
-        logger.info("Finished fetching TRaSH metadata")
-
-    # Do pre-initialisation rendering of instance configuration, if any instance requires it.
-    logger.info("Rendering instance configuration dynamic attributes")
-    render_instance_configs()
-    logger.info("Finished rendering instance configuration dynamic attributes")
-
-    # Initialise any instances that have not been initialised yet.
-    # For applicable instances, this needs to be done before the main API can be queried,
-    # or secrets can even be checked.
-    for plugin_name, instance_name in state._execution_order:
-        manager = state.managers[plugin_name]
-        instance_config = state.instance_configs[plugin_name][instance_name]
-        with state._with_context(plugin_name=plugin_name, instance_name=instance_name):
-            logger.debug("Checking if the instance is initialised")
-            try:
-                is_initialized = manager.is_initialized(instance_config)
-            except NotImplementedError:
-                logger.debug("Initialisation is not required for this instance type")
-                continue
-            if is_initialized:
-                logger.debug("Instance is initialised and ready for configuration updates")
-            else:
-                logger.info("Instance has not been initialised")
-                logger.info("Initialising instance")
-                manager.initialize(
-                    (
-                        plugin_name
-                        if instance_name == "default"
-                        else f"{plugin_name}.instances[{instance_config!r}]"
-                    ),
-                    instance_config,
-                )
-                logger.info("Finished initialising instance")
-
-    # Generate the secrets structure for each plugin and instance,
-    # using the old structure cached from file as a base, and
-    # fetching them from the remote instance if they don't exist.
-    for plugin_name in state.active_plugins:
-        plugin_secrets: Dict[str, SecretsPlugin] = cast(
-            Dict[str, SecretsPlugin],
-            state.instance_secrets[plugin_name],
-        )
-        for instance_name, instance_config in state.instance_configs[plugin_name].items():
+    # Operations on the remote instances are run concurrently on a pool of worker threads,
+    # which is shared between all stages of the update run.
+    # Once all instances have been updated, the pool is shut down, connections to
+    # the instances opened by the secrets objects are closed and any leftover temporary files
+    # are removed, even if the update failed.
+    executor = ThreadPoolExecutor(
+        max_workers=state.config.buildarr.max_concurrent_instances,
+        thread_name_prefix="buildarr-instance",
+    )
+    try:
+        # Fetch TRaSH-Guides metadata in the background, if at least one instance requires it.
+        # Instances are rendered in execution order, so the download is only waited on
+        # right before the first instance that uses the metadata is rendered.
+        trash_metadata_instances = get_trash_metadata_instances()
+        with ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="buildarr-trash",
+        ) as trash_metadata_executor:
+            if trash_metadata_instances:
+                logger.info("Fetching TRaSH metadata")
+                trash_metadata_future = trash_metadata_executor.submit(fetch_trash_metadata)
+            trash_metadata_index = next(
+                (
+                    i
+                    for i, plugin_instance in enumerate(state._execution_order)
+                    if plugin_instance in trash_metadata_instances
+                ),
+                len(state._execution_order),
+            )
+
+            # Do pre-initialisation rendering of instance configuration,
+            # if any instance requires it.
+            logger.info("Rendering instance configuration dynamic attributes")
+            render_instance_configs(state._execution_order[:trash_metadata_index])
+            if trash_metadata_instances:
+                trash_metadata_future.result()
+                logger.info("Finished fetching TRaSH metadata")
+                render_instance_configs(state._execution_order[trash_metadata_index:])
+            logger.info("Finished rendering instance configuration dynamic attributes")
+
+        # Initialise any instances that have not been initialised yet.
+        # For applicable instances, this needs to be done before the main API can be queried,
+        # or secrets can even be checked.
+        for plugin_name, instance_name in state._execution_order:
+            manager = state.managers[plugin_name]
+            instance_config = state.instance_configs[plugin_name][instance_name]
             with state._with_context(plugin_name=plugin_name, instance_name=instance_name):
-                logger.info("Fetching instance secrets")
-                instance_secrets: SecretsPlugin = state.plugins[plugin_name].secrets.get(
-                    instance_config,
-                )
-                logger.info("Finished fetching instance secrets")
-                logger.info("Running connection test")
-                if instance_secrets.test():
-                    logger.info("Connection test successful")
-                    plugin_secrets[instance_name] = instance_secrets
+                logger.debug("Checking if the instance is initialised")
+                try:
+                    is_initialized = manager.is_initialized(instance_config)
+                except NotImplementedError:
+                    logger.debug("Initialisation is not required for this instance type")
+                    continue
+                if is_initialized:
+                    logger.debug("Instance is initialised and ready for configuration updates")
                 else:
-                    raise RunInstanceConnectionTestFailedError(
-                        f"Connection test failed for instance '{instance_name}': "
-                        f"{instance_secrets}",
+                    logger.info("Instance has not been initialised")
+                    logger.info("Initialising instance")
+                    manager.initialize(
+                        (
+                            plugin_name
+                            if instance_name == "default"
+                            else f"{plugin_name}.instances[{instance_config!r}]"
+                        ),
+                        instance_config,
                     )
+                    logger.info("Finished initialising instance")
+
+        # Generate the secrets structure for each plugin and instance,
+        # fetching them from the remote instances.
+        # This is done for multiple instances concurrently, as it is mostly spent
+        # waiting on responses from the instances. If any instances fail,
+        # instances not yet started are cancelled, and the error
+        # for the first failed instance (in execution order) is raised.
+        futures = [
+            executor.submit(
+                _fetch_instance_secrets,
+                plugin_name,
+                instance_name,
+                state.instance_configs[plugin_name][instance_name],
+            )
+            for plugin_name, instance_name in state._execution_order
+        ]
+        _wait_for_instances(futures)
+        for (plugin_name, instance_name), future in zip(state._execution_order, futures):
+            if not future.cancelled():
+                state.instance_secrets[plugin_name][instance_name] = future.result()  # type: ignore[index]
+
+        # Do post-initialisation rendering of instance configuration, if any instance requires it.
+        logger.info("Performing post-initialisation configuration render")
+        post_init_render()
+        logger.info("Finished performing post-initialisation configuration render")
+
+        # Cleanup downloaded TRaSH-Metadata, if it was required by any instances.
+        # It is only used while rendering, so there is no need to keep it
+        # while the remote instances are being updated.
+        if state.trash_metadata_dir:
+            logger.info("Deleting downloaded TRaSH metadata")
+            cleanup_trash_metadata()
+            logger.info("Finished deleting downloaded TRaSH metadata")
+
+        # Update all instances in the determined execution order.
+        # Instances that do not depend on each other are updated concurrently.
+        execution_layers = _get_execution_layers()
+        logger.info("Updating configuration on remote instances")
+        _run_execution_layers(executor, _update_instance, execution_layers)
+        logger.info("Finished updating configuration on remote instances")
+
+        # After all configuration and resources have been created/updated on
+        # the remote instances, make another pass and remove any unmanaged or
+        # unused resources slated for deletion.
+        # The execution order is the reverse of the normal order, to ensure
+        # any resources on source instances that depend on resources on
+        # target instances (via instance links) are removed first.
+        logger.info("Deleting unmanaged/unused resources on remote instances")
+        _run_execution_layers(
+            executor,
+            _delete_instance,
+            [layer[::-1] for layer in reversed(execution_layers)],
+        )
+        logger.info("Finished deleting unmanaged/unused resources on remote instances")
+    finally:
+        executor.shutdown()
+        for plugin_name, instance_secrets in state.instance_secrets.items():
+            for instance_name, secrets in instance_secrets.items():
+                with state._with_context(plugin_name=plugin_name, instance_name=instance_name):
+                    try:
+                        secrets.close()
+                    except Exception as err:
+                        logger.exception(
+                            "An error occurred while closing instance secrets: %s", err
+                        )
+        # Make sure the downloaded TRaSH metadata is removed
+        # if the update run failed before it could be cleaned up.
+        if state.trash_metadata_dir:
+            cleanup_trash_metadata()
+
+
+def _fetch_instance_secrets(
+    plugin_name: str,
+    instance_name: str,
+    instance_config: ConfigPlugin,
+) -> SecretsPlugin:
+    """
+    Fetch the secrets for the given instance, and run a connection test using them.
+
+    Args:
+        plugin_name (str): Name of the plugin the instance belongs to.
+        instance_name (str): Name of the instance.
+        instance_config (ConfigPlugin): Configuration for the instance.
+
+    Raises:
+        RunInstanceConnectionTestFailedError: If the connection test failed
+
+    Returns:
+        Secrets for the instance
+    """
+
+    with state._with_context(plugin_name=plugin_name, instance_name=instance_name):
+        logger.info("Fetching instance secrets")
+        instance_secrets: SecretsPlugin = state.plugins[plugin_name].secrets.get(instance_config)
+        logger.info("Finished fetching instance secrets")
+        logger.info("Running connection test")
+        if not instance_secrets.test():
+            raise RunInstanceConnectionTestFailedError(
+                f"Connection test failed for instance '{instance_name}': {instance_secrets}",
+            )
+        logger.info("Connection test successful")
+    return instance_secrets
+
+
+def _get_execution_layers() -> List[List[PluginInstanceRef]]:
+    """
+    Group the instances in the execution order into layers, where each instance
+    only depends on instances in the layers before it.
+
+    Instances within the same layer do not depend on each other,
+    and can be processed concurrently.
+
+    Returns:
+        List of plugin-instance reference layers, in execution order
+    """
+
+    layers: List[List[PluginInstanceRef]] = []
+    instance_layers: Dict[PluginInstanceRef, int] = {}
+
+    for plugin_instance in state._execution_order:
+        layer = max(
+            (
+                instance_layers[target_plugin_instance] + 1
+                for target_plugin_instance in state._instance_dependencies.get(
+                    plugin_instance,
+                    (),
+                )
+            ),
+            default=0,
+        )
+        instance_layers[plugin_instance] = layer
+        if layer == len(layers):
+            layers.append([])
+        layers[layer].append(plugin_instance)
+
+    return layers
+
+
+def _run_execution_layers(
+    executor: Executor,
+    func: Callable[[str, str], None],
+    layers: Sequence[Sequence[PluginInstanceRef]],
+) -> None:
+    """
+    Run the given function on every instance, one layer at a time.
 
-    # Do post-initialisation rendering of instance configuration, if any instance requires it.
-    logger.info("Performing post-initialisation configuration render")
-    post_init_render()
-    logger.info("Finished performing post-initialisation configuration render")
-
-    # Update all instances in the determined execution order.
-    logger.info("Updating configuration on remote instances")
-    for plugin_name, instance_name in state._execution_order:
-        manager = state.managers[plugin_name]
-        instance_config = state.instance_configs[plugin_name][instance_name]
-        with state._with_context(plugin_name=plugin_name, instance_name=instance_name):
-            instance_secrets = state.instance_secrets[plugin_name][instance_name]
-            logger.info("Fetching remote configuration to check if updates are required")
-            remote_instance_config = manager.from_remote(instance_config, instance_secrets)
-            logger.info("Finished fetching remote configuration")
+    The instances within each layer are processed concurrently. If any instances fail,
+    instances in the layer that have not started yet are cancelled, the instances
+    already being processed are allowed to finish, and the error
+    for the first failed instance (in execution order) is raised.
+
+    Args:
+        executor (Executor): Executor to process the instances with.
+        func (Callable[[str, str], None]): Function to call with the plugin and instance name.
+        layers (Sequence[Sequence[PluginInstanceRef]]): Plugin-instance reference layers.
+    """
+
+    for layer in layers:
+        futures = [
+            executor.submit(func, plugin_name, instance_name)
+            for plugin_name, instance_name in layer
+        ]
+        _wait_for_instances(futures)
+        for future in futures:
+            if not future.cancelled():
+                future.result()
+
+
+def _wait_for_instances(futures: Sequence[Future[Any]]) -> None:
+    """
+    Wait for all of the given instance operations to finish.
+
+    If any of the operations fail, or waiting is interrupted (e.g. by `Ctrl-C`),
+    operations that have not started yet are cancelled, so no further changes
+    are made to the remote instances. Operations that are already running
+    are waited on until they finish.
+
+    Args:
+        futures (Sequence[Future[Any]]): Futures for the submitted instance operations.
+    """
+
+    try:
+        wait(futures, return_when=FIRST_EXCEPTION)
+    finally:
+        for future in futures:
+            future.cancel()
+        wait(futures)
+
+
+def _update_instance(plugin_name: str, instance_name: str) -> None:
+    """
+    Fetch the remote configuration for the given instance,
+    and push any required updates to it.
+
+    Args:
+        plugin_name (str): Name of the plugin the instance belongs to.
+        instance_name (str): Name of the instance.
+    """
+
+    manager = state.managers[plugin_name]
+    instance_config = state.instance_configs[plugin_name][instance_name]
+    with state._with_context(plugin_name=plugin_name, instance_name=instance_name):
+        instance_secrets = state.instance_secrets[plugin_name][instance_name]
+        logger.info("Fetching remote configuration to check if updates are required")
+        remote_instance_config = manager.from_remote(instance_config, instance_secrets)
+        logger.info("Finished fetching remote configuration")
+        if logger.isEnabledFor(DEBUG):
             for config_type, config in (
                 ("Local", instance_config),
                 ("Remote", remote_instance_config),
             ):
                 logger.debug("%s configuration:", config_type)
                 for config_line in config.model_dump_yaml(exclude_unset=True).splitlines():
-                    logger.debug(indent(config_line, "  "))
-            logger.info("Updating remote configuration")
-            logger.info(
-                (
-                    "Remote configuration successfully updated"
-                    if manager.update_remote(
-                        plugin_name,
-                        instance_config,
-                        instance_secrets,
-                        remote_instance_config,
-                    )
-                    else "Remote configuration is up to date"
-                ),
-            )
-            logger.info("Finished updating remote configuration")
-    logger.info("Finished updating configuration on remote instances")
-
-    # After all configuration and resources have been created/updated on
-    # the remote instances, make another pass and remove any unmanaged or
-    # unused resources slated for deletion.
-    # The execution order is the reverse of the normal order, to ensure
-    # any resources on source instances that depend on resources on
-    # target instances (via instance links) are removed first.
-    logger.info("Deleting unmanaged/unused resources on remote instances")
-    for plugin_name, instance_name in reversed(state._execution_order):
-        manager = state.managers[plugin_name]
-        instance_config = state.instance_configs[plugin_name][instance_name]
-        with state._with_context(plugin_name=plugin_name, instance_name=instance_name):
-            instance_secrets = state.instance_secrets[plugin_name][instance_name]
-            logger.info("Refetching remote configuration to delete unused resources")
-            remote_instance_config = manager.from_remote(instance_config, instance_secrets)
-            logger.info("Finished refetching remote configuration")
+                    logger.debug("  %s", config_line)
+        logger.info("Updating remote configuration")
+        logger.info(
+            (
+                "Remote configuration successfully updated"
+                if manager.update_remote(
+                    plugin_name,
+                    instance_config,
+                    instance_secrets,
+                    remote_instance_config,
+                )
+                else "Remote configuration is up to date"
+            ),
+        )
+        logger.info("Finished updating remote configuration")
+
+
+def _delete_instance(plugin_name: str, instance_name: str) -> None:
+    """
+    Refetch the remote configuration for the given instance,
+    and delete any unmanaged/unused resources on it.
+
+    Args:
+        plugin_name (str): Name of the plugin the instance belongs to.
+        instance_name (str): Name of the instance.
+    """
+
+    manager = state.managers[plugin_name]
+    instance_config = state.instance_configs[plugin_name][instance_name]
+    with state._with_context(plugin_name=plugin_name, instance_name=instance_name):
+        instance_secrets = state.instance_secrets[plugin_name][instance_name]
+        logger.info("Refetching remote configuration to delete unused resources")
+        remote_instance_config = manager.from_remote(instance_config, instance_secrets)
+        logger.info("Finished refetching remote configuration")
+        if logger.isEnabledFor(DEBUG):
             for config_type, config in (
                 ("Local", instance_config),
                 ("Remote", remote_instance_config),
             ):
                 logger.debug("%s configuration:", config_type)
                 for config_line in config.model_dump_yaml(exclude_unset=True).splitlines():
-                    logger.debug(indent(config_line, "  "))
-            logger.info("Deleting unmanaged/unused resources on the remote instance")
-            logger.info(
-                (
-                    "Unused resources successfully deleted"
-                    if manager.delete_remote(
-                        plugin_name,
-                        instance_config,
-                        instance_secrets,
-                        remote_instance_config,
-                    )
-                    else "Remote configuration is clean"
-                ),
-            )
-            logger.info("Finished deleting unmanaged/unused resources on the remote instance")
-    logger.info("Finished deleting unmanaged/unused resources on remote instances")
-
-    # Cleanup downloaded TRaSH-Metadata, if it was required by any instances.
-    if state.trash_metadata_dir:
-        logger.info("Deleting downloaded TRaSH metadata")
-        cleanup_trash_metadata()
-        logger.info("Finished deleting downloaded TRaSH metadata")
+                    logger.debug("  %s", config_line)
+        logger.info("Deleting unmanaged/unused resources on the remote instance")
+        logger.info(
+            (
+                "Unused resources successfully deleted"
+                if manager.delete_remote(
+                    plugin_name,
+                    instance_config,
+                    instance_secrets,
+                    remote_instance_config,
+                )
+                else "Remote configuration is clean"
+            ),
+        )
+        logger.info("Finished deleting unmanaged/unused resources on the remote instance")
@@ -18,9 +18,8 @@
 
 from __future__ import annotations
 
-from logging import getLogger
+from logging import DEBUG, getLogger
 from pathlib import Path
-from textwrap import indent
 from typing import TYPE_CHECKING
 
 import click
@@ -35,7 +34,7 @@ from ..config import (
 from ..logging import get_log_level
 from ..manager import load_managers
 from ..state import state
-from ..trash import cleanup_trash_metadata, fetch_trash_metadata, trash_metadata_used
+from ..trash import cleanup_trash_metadata, fetch_trash_metadata, get_trash_metadata_instances
 from ..util import get_resolved_path
 from . import cli
 from .exceptions import TestConfigNoPluginsDefinedError
@@ -92,6 +91,8 @@ def test_config(config_path: Path, use_plugins: Set[str]) -> None:
         use_plugins (Set[str]): Plugins to load. If empty, use all plugins.
     """
 
+    cli.load_plugins()
+
     logger.info("Buildarr version %s (log level: %s)", __version__, get_log_level())
     plugin_strs = [f"{pn} ({state.plugins[pn].version})" for pn in sorted(state.plugins.keys())]
     logger.info(
@@ -107,9 +108,10 @@ def test_config(config_path: Path, use_plugins: Set[str]) -> None:
         logger.error("Loading configuration: FAILED")
         raise
     else:
-        logger.debug("Buildarr configuration:")
-        for config_line in state.config.model_dump_yaml(exclude_unset=True).splitlines():
-            logger.debug(indent(config_line, "  "))
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("Buildarr configuration:")
+            for config_line in state.config.model_dump_yaml(exclude_unset=True).splitlines():
+                logger.debug("  %s", config_line)
         logger.info("Loading configuration: PASSED")
 
     # Load the manager objects for the selected plugins.
@@ -131,14 +133,15 @@ def test_config(config_path: Path, use_plugins: Set[str]) -> None:
         logger.error("Loading instance configurations: FAILED")
         raise
     else:
-        for plugin_name, instance_configs in state.instance_configs.items():
-            for instance_name, instance_config in instance_configs.items():
-                with state._with_context(plugin_name=plugin_name, instance_name=instance_name):
-                    logger.debug("Instance configuration:")
-                    for config_line in instance_config.model_dump_yaml(
-                        exclude_unset=True,
-                    ).splitlines():
-                        logger.debug(indent(config_line, "  "))
+        if logger.isEnabledFor(DEBUG):
+            for plugin_name, instance_configs in state.instance_configs.items():
+                for instance_name, instance_config in instance_configs.items():
+                    with state._with_context(plugin_name=plugin_name, instance_name=instance_name):
+                        logger.debug("Instance configuration:")
+                        for config_line in instance_config.model_dump_yaml(
+                            exclude_unset=True,
+                        ).splitlines():
+                            logger.debug("  %s", config_line)
         logger.info("Loading instance configurations: PASSED")
 
     # Check if configuration was found for any selected plugins.
@@ -162,7 +165,10 @@ def test_config(config_path: Path, use_plugins: Set[str]) -> None:
         logger.info("Resolving instance dependencies: PASSED")
 
     # Test fetching TRaSH-Guides metadata, if the configuration uses it.
-    downloaded_trash_metadata = trash_metadata_used()
+    # The instances using it are kept so they don't need to be checked again
+    # when logging the rendered configuration.
+    trash_metadata_instances = get_trash_metadata_instances()
+    downloaded_trash_metadata = bool(trash_metadata_instances)
     if downloaded_trash_metadata:
         try:
             logger.debug("Fetching TRaSH metadata")
@@ -202,15 +208,17 @@ def test_config(config_path: Path, use_plugins: Set[str]) -> None:
         logger.info("Cleaning up TRaSH-Guides metadata: SKIPPED (not required)")
 
     # Log the pre-initialisation rendered configuration to debug output.
-    for plugin_name, instance_configs in state.instance_configs.items():
-        for instance_name, instance_config in instance_configs.items():
+    if logger.isEnabledFor(DEBUG):
+        for plugin_name, instance_name in state._execution_order:
+            if (plugin_name, instance_name) not in trash_metadata_instances:
+                continue
+            instance_config = state.instance_configs[plugin_name][instance_name]
             with state._with_context(plugin_name=plugin_name, instance_name=instance_name):
-                if state.managers[plugin_name].uses_trash_metadata(instance_config):
-                    logger.debug("Rendered instance configuration:")
-                    for config_line in instance_config.model_dump_yaml(
-                        exclude_unset=True,
-                    ).splitlines():
-                        logger.debug(indent(config_line, "  "))
+                logger.debug("Rendered instance configuration:")
+                for config_line in instance_config.model_dump_yaml(
+                    exclude_unset=True,
+                ).splitlines():
+                    logger.debug("  %s", config_line)
 
     # If we get to this point, this configuration is pretty much guaranteed to be valid.
     # Incorrect values for a remote application instance notwithstanding, it should
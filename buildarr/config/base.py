@@ -38,13 +38,12 @@ from typing import (
 )
 from uuid import UUID
 
-import yaml
-
 from pydantic import AnyUrl, BaseModel, NameEmail, SecretStr as PydanticSecretStr
 from typing_extensions import Self
 
 from ..plugins import Secrets
 from ..types import BaseEnum, model_config_base
+from ..util import yaml_safe_dump
 from .types import RemoteMapEntry
 
 logger = getLogger(__name__)
@@ -823,7 +822,7 @@ class ConfigBase(BaseModel, Generic[Secrets]):
         Returns:
             YAML representation of the model
         """
-        return yaml.safe_dump(  # type: ignore[call-overload]
+        return yaml_safe_dump(
             self.model_dump(mode="json", **kwargs),
             **{**(yaml_kwargs or {}), "sort_keys": sort_keys},
         )
@@ -24,7 +24,7 @@ from datetime import time
 from pathlib import Path
 from typing import Optional, Set
 
-from pydantic import AnyHttpUrl, PositiveFloat
+from pydantic import AnyHttpUrl, PositiveFloat, PositiveInt
 
 from ..types import DayOfWeek, NonEmptyStr
 from .base import ConfigBase
@@ -70,6 +70,30 @@ class BuildarrConfig(ConfigBase):
     This configuration option can be overridden using the `--watch-config` command line argument.
     """
 
+    watch_config_polling: bool = False
+    """
+    When set to `true`, Buildarr will periodically poll the configuration files for changes
+    when `watch_config` is enabled, instead of using native filesystem notifications.
+
+    Native notifications do not work on some filesystems. On Linux, polling is used
+    automatically for configuration files on network filesystems (e.g. NFS, SMB)
+    and FUSE filesystems, but some other setups (e.g. some Docker bind mounts)
+    cannot be detected, so enable this option if configuration file changes
+    are not being detected.
+    """
+
+    watch_config_interval: PositiveFloat = 30  # seconds
+    """
+    The interval between checks for configuration file changes (in seconds),
+    when the configuration files are being polled for changes.
+
+    This has no effect when native filesystem notifications are used,
+    which detect changes immediately.
+
+    This configuration option can be overridden using the `--watch-interval`
+    command line argument.
+    """
+
     update_days: Set[DayOfWeek] = set(day for day in DayOfWeek)
     """
     The days Buildarr daemon will run update operations on.
@@ -120,6 +144,18 @@ class BuildarrConfig(ConfigBase):
     *New in version 0.3.0.*
     """
 
+    max_concurrent_instances: PositiveInt = 1
+    """
+    The maximum number of instances Buildarr will communicate with at the same time.
+
+    When set higher than `1`, operations that do not depend on each other,
+    such as fetching instance secrets and updating instances, are performed
+    on multiple instances concurrently to reduce the time taken by each update run.
+
+    By default, instances are processed one at a time. Only increase this
+    if all plugins in use support processing instances concurrently.
+    """
+
     trash_metadata_download_url: AnyHttpUrl = AnyHttpUrl(
         "https://github.com/TRaSH-/Guides/archive/refs/heads/master.zip"
     )
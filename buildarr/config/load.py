@@ -18,8 +18,15 @@ Buildarr configuration loading function.
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import sys
+
+from functools import lru_cache
 from logging import getLogger
 from pathlib import Path
+from tempfile import mkstemp
 from typing import (
     TYPE_CHECKING,
     Type,
@@ -29,13 +36,11 @@ from typing import (
     get_origin as get_type_origin,
 )
 
-import yaml
-
 from pydantic import create_model
 
 from ..state import state
 from ..types import LocalPath
-from ..util import get_absolute_path, merge_dicts
+from ..util import get_absolute_path, merge_dicts, yaml_safe_load
 from .base import ConfigBase
 from .buildarr import BuildarrConfig
 from .models import ConfigType
@@ -50,36 +55,39 @@ logger = getLogger(__name__)
 OPTIONAL_TYPE_UNION_SIZE = 2
 
 
-def load_config(path: Path, use_plugins: Optional[Set[str]] = None) -> None:
+def load_config(
+    path: Path,
+    use_plugins: Optional[Set[str]] = None,
+    use_cache: bool = False,
+) -> None:
     """
     Load a configuration file using the given plugins.
 
+    If `use_cache` is enabled, the parsed contents of each configuration file
+    are cached to a JSON file in the Buildarr cache directory,
+    and reused instead of parsing the YAML file again until its contents change.
+
     Args:
         use_plugins (Optional[Set[str]]): Plugins to use. Default is to use all plugins.
         path (Union[str, PathLike]): Buildarr configuration file.
+        use_cache (bool, optional): Cache parsed configuration files. Defaults to `False`.
 
     Returns:
         2-tuple of the list of files loaded and the global configuration object
     """
 
     logger.debug("Building configuration model")
-    model = cast(
-        Type[ConfigType],
-        create_model(  # type: ignore[call-overload]
-            "Config",
-            __base__=ConfigBase,
-            buildarr=(BuildarrConfig, BuildarrConfig()),
-            **{
-                plugin_name: (plugin.config, plugin.config())
-                for plugin_name, plugin in state.plugins.items()
-                if not use_plugins or plugin_name in use_plugins
-            },
+    model = _get_config_model(
+        tuple(
+            (plugin_name, plugin.config)
+            for plugin_name, plugin in state.plugins.items()
+            if not use_plugins or plugin_name in use_plugins
         ),
     )
     logger.debug("Finished building configuration model")
 
     logger.debug("Loading configuration file tree")
-    files, configs = _get_files_and_configs(model, path)
+    files, configs = _get_files_and_configs(model, path, use_cache=use_cache)
     logger.debug("Finished loading configuration file tree")
 
     logger.debug("Merging configuration objects in order of file predecence:")
@@ -96,9 +104,32 @@ def load_config(path: Path, use_plugins: Optional[Set[str]] = None) -> None:
     state.config_files = files
 
 
+@lru_cache(maxsize=16)
+def _get_config_model(
+    plugin_configs: Tuple[Tuple[str, Type[ConfigPlugin]], ...],
+) -> Type[ConfigType]:
+    # Create the global configuration model for the given plugins.
+    # Building the model (and its validation schema) is expensive, so the model
+    # is cached, and reused when the same plugins are loaded again
+    # (e.g. when the Buildarr daemon reloads the configuration).
+    return cast(
+        Type[ConfigType],
+        create_model(  # type: ignore[call-overload]
+            "Config",
+            __base__=ConfigBase,
+            buildarr=(BuildarrConfig, BuildarrConfig()),
+            **{
+                plugin_name: (plugin_config, plugin_config())
+                for plugin_name, plugin_config in plugin_configs
+            },
+        ),
+    )
+
+
 def _get_files_and_configs(
     model: Type[ConfigType],
     path: Path,
+    use_cache: bool = False,
 ) -> Tuple[List[Path], List[Dict[str, ConfigPlugin]]]:
     # Load a configuration file.
     # If other files are included using the `includes` list structure,
@@ -120,23 +151,22 @@ def _get_files_and_configs(
     # relative to the actual configuration file the value was loaded from.
     #
     # Once processing is done, add it to the list of configuration dictionaries to merge.
-    with path.open(mode="r") as f:
-        config: Optional[Dict[str, Any]] = yaml.safe_load(f)
-        if config is None:
-            config = {}
-        if not isinstance(config, dict):
-            raise ValueError(
-                f"Error while loading configuration file '{path}': "
-                "Invalid configuration object type "
-                f"(got '{type(config).__name__}', expected 'dict'): {config}",
-            )
-        configs.append(
-            _expand_relative_paths(
-                config_dir=path.parent,
-                value_type=model,
-                value={k: v for k, v in config.items() if k != "includes"},
-            ),
+    config: Optional[Dict[str, Any]] = _load_file(path, use_cache=use_cache)
+    if config is None:
+        config = {}
+    if not isinstance(config, dict):
+        raise ValueError(
+            f"Error while loading configuration file '{path}': "
+            "Invalid configuration object type "
+            f"(got '{type(config).__name__}', expected 'dict'): {config}",
         )
+    configs.append(
+        _expand_relative_paths(
+            config_dir=path.parent,
+            value_type=model,
+            value={k: v for k, v in config.items() if k != "includes"},
+        ),
+    )
 
     # If other files were included using the `includes` list structure,
     # recursively load them and add them to the list of files and objects.
@@ -156,13 +186,83 @@ def _get_files_and_configs(
             else:
                 include_path = get_absolute_path(path.parent / ip)
                 logger.debug("Expanding relative local path '%s' into '%s'", ip, include_path)
-            _files, _configs = _get_files_and_configs(model, include_path)
+            _files, _configs = _get_files_and_configs(model, include_path, use_cache=use_cache)
             files.extend(_files)
             configs.extend(_configs)
 
     return (files, configs)
 
 
+def _load_file(path: Path, use_cache: bool = False) -> Any:
+    # Parse a YAML configuration file, and return the resulting object.
+    #
+    # If caching is enabled, the parsed object is saved to a JSON file in the
+    # Buildarr cache directory, along with a digest of the contents of the
+    # configuration file at the time it was parsed. On subsequent loads, if the
+    # contents of the configuration file are unchanged, the cached object is used instead,
+    # as decoding JSON is much faster than parsing YAML.
+    #
+    # The cache file contains secrets (e.g. API keys) defined in the configuration file,
+    # so it is only readable by the current user.
+    #
+    # Caching is best-effort. If the cache file cannot be read or written,
+    # or the parsed object cannot be represented exactly in JSON
+    # (e.g. non-string keys or dates), the configuration file is simply parsed as normal.
+    if not use_cache:
+        with path.open(mode="r") as f:
+            return yaml_safe_load(f)
+    content = path.read_bytes()
+    digest = hashlib.blake2b(content).hexdigest()
+    cache_path = (
+        _get_cache_dir()
+        / "config"
+        / f"{hashlib.blake2b(str(path.absolute()).encode()).hexdigest()}.json"
+    )
+    try:
+        with cache_path.open(mode="r") as f:
+            cache = json.load(f)
+        if cache["digest"] == digest:
+            logger.debug("Using cached configuration file '%s'", cache_path)
+            return cache["config"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    config = yaml_safe_load(content)
+    try:
+        cache_json = json.dumps({"digest": digest, "config": config})
+    except (TypeError, ValueError):
+        return config
+    if json.loads(cache_json)["config"] != config:
+        return config
+    try:
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # The temporary file is created with permissions that only allow
+        # the current user to access it, which are kept when it is moved into place.
+        fd, temp_file = mkstemp(prefix=f".{cache_path.name}.", dir=cache_path.parent)
+        temp_path = Path(temp_file)
+        try:
+            with os.fdopen(fd, mode="w") as f:
+                f.write(cache_json)
+            temp_path.replace(cache_path)
+        except BaseException:
+            temp_path.unlink()
+            raise
+    except OSError as err:
+        logger.debug("Unable to write configuration cache file '%s': %s", cache_path, err)
+    else:
+        logger.debug("Wrote configuration cache file '%s'", cache_path)
+    return config
+
+
+def _get_cache_dir() -> Path:
+    # Return the directory Buildarr stores cached files in.
+    # The `$BUILDARR_CACHE_DIR` environment variable takes precedence if set,
+    # otherwise a `buildarr` directory in the user's cache directory is used.
+    if os.environ.get("BUILDARR_CACHE_DIR"):
+        return Path(os.environ["BUILDARR_CACHE_DIR"])
+    cache_home = os.environ.get("LOCALAPPDATA" if sys.platform == "win32" else "XDG_CACHE_HOME")
+    return (Path(cache_home) if cache_home else Path.home() / ".cache") / "buildarr"
+
+
 def _expand_relative_paths(
     config_dir: Path,
     value_type: Type[Any],
@@ -281,18 +381,19 @@ def load_instance_configs(use_plugins: Optional[Set[str]] = None) -> None:
     configs: Dict[str, Dict[str, ConfigPlugin]] = {}
     active_plugins: Set[str] = set()
 
-    for plugin_name in state.plugins.keys():
-        if use_plugins and plugin_name not in use_plugins:
-            continue
-        if plugin_name not in state.config.model_fields_set:
-            continue
+    # Only load instance configurations for installed plugins that are configured in Buildarr.
+    plugin_names = state.plugins.keys() & state.config.model_fields_set
+    if use_plugins:
+        plugin_names &= use_plugins
+
+    # Intern the plugin and instance names, as they are used (in tuples)
+    # as keys for a number of dictionaries in the global state.
+    for plugin_name in map(sys.intern, sorted(plugin_names)):
         plugin_manager = state.managers[plugin_name]
         plugin_config: ConfigPluginType = getattr(state.config, plugin_name)
         active_plugins.add(plugin_name)
         configs[plugin_name] = {}
-        for instance_name in (
-            plugin_config.instances.keys() if plugin_config.instances else ["default"]
-        ):
+        for instance_name in map(sys.intern, plugin_config.instances or ("default",)):
             # Load the instance-specific configuration under aninstance-specific context,
             # so that when the configuration gets evaluated by the parser,
             # `InstanceReference` annotations are properly validated, and
@@ -25,14 +25,17 @@ from typing import TYPE_CHECKING
 from ..state import state
 
 if TYPE_CHECKING:
-    from typing import DefaultDict, Dict
+    from typing import DefaultDict, Dict, Optional, Sequence
 
+    from ..state import PluginInstanceRef
     from .models import ConfigPlugin
 
 logger = getLogger(__name__)
 
 
-def render_instance_configs() -> None:
+def render_instance_configs(
+    plugin_instances: Optional[Sequence[PluginInstanceRef]] = None,
+) -> None:
     """
     Render dynamically populated attributes on instance configurations,
     and update the global state.
@@ -40,11 +43,23 @@ def render_instance_configs() -> None:
     If an instance configuration returned `True` for `uses_trash_metadata`,
     the filepath to the downloaded metadata directory will be available as
     `state.trash_metadata_dir` in the global state.
+
+    Args:
+        plugin_instances (Optional[Sequence[PluginInstanceRef]], optional): Instances to render.
+            If unset, render all instances in the execution order.
     """
 
-    instance_configs: DefaultDict[str, Dict[str, ConfigPlugin]] = defaultdict(dict)
+    instance_configs: DefaultDict[str, Dict[str, ConfigPlugin]] = defaultdict(
+        dict,
+        {
+            plugin_name: dict(plugin_instance_configs)
+            for plugin_name, plugin_instance_configs in state.instance_configs.items()
+        },
+    )
 
-    for plugin_name, instance_name in state._execution_order:
+    for plugin_name, instance_name in (
+        state._execution_order if plugin_instances is None else plugin_instances
+    ):
         manager = state.managers[plugin_name]
         instance_config = state.instance_configs[plugin_name][instance_name]
         with state._with_context(plugin_name=plugin_name, instance_name=instance_name):
@@ -18,12 +18,14 @@ Buildarr configuration instance-to-instance dependency resolution functions.
 
 from __future__ import annotations
 
+import heapq
+
 from typing import TYPE_CHECKING
 
 from ..state import state
 
 if TYPE_CHECKING:
-    from typing import List, Optional, Set
+    from typing import Dict, List, Set
 
     from ..state import PluginInstanceRef
 
@@ -36,95 +38,125 @@ def resolve_instance_dependencies() -> None:
     This function requires `config.load_instance_configs` to be run first,
     as that function populates `state._instance_dependencies`, which this function uses.
 
-    A depth-first search on the `state._instance_dependencies` dependency tree structure
-    is performed, which is generated using instance name references defined within
-    Buildarr instance configurations.
+    A topological sort (using Kahn's algorithm) is performed on the
+    `state._instance_dependencies` dependency tree structure, which is generated
+    using instance name references defined within Buildarr instance configurations.
+    When more than one instance is ready to be processed, they are ordered
+    by plugin name, and then by instance name.
+
+    Raises:
+        ValueError: When a plugin used in an instance reference is not installed
+        ValueError: When a plugin used in an instance reference is disabled or not configured
+        ValueError: When a dependency cycle is detected
     """
 
-    added_plugin_instances: Set[PluginInstanceRef] = set()
-    execution_order: List[PluginInstanceRef] = []
+    # Number of unprocessed dependencies for each instance,
+    # and the instances that depend on each instance.
+    num_dependencies: Dict[PluginInstanceRef, int] = {}
+    dependents: Dict[PluginInstanceRef, List[PluginInstanceRef]] = {}
 
     for plugin_name in state.active_plugins:
-        for instance_name in sorted(state.instance_configs[plugin_name].keys()):
-            _resolve_instance_dependencies(
-                added_plugin_instances=added_plugin_instances,
-                execution_order=execution_order,
-                plugin_name=plugin_name,
-                instance_name=instance_name,
-            )
+        for instance_name in state.instance_configs[plugin_name].keys():
+            num_dependencies[(plugin_name, instance_name)] = 0
+            dependents[(plugin_name, instance_name)] = []
+
+    for plugin_instance, target_plugin_instances in state._instance_dependencies.items():
+        for target_plugin_instance in target_plugin_instances:
+            target_plugin, _ = target_plugin_instance
+            # NOTE: Due to similar checks being run in the instance configuration loading
+            # stage in the `InstanceReference` annotation, in practice this check
+            # will never actually be used. It is still defined here as well, just in case.
+            if target_plugin not in state.instance_configs:  # pragma: no cover
+                raise ValueError(
+                    _get_unresolved_dependency_message(plugin_instance, target_plugin_instance),
+                )
+            num_dependencies[plugin_instance] = num_dependencies.get(plugin_instance, 0) + 1
+            dependents.setdefault(plugin_instance, [])
+            num_dependencies.setdefault(target_plugin_instance, 0)
+            dependents.setdefault(target_plugin_instance, []).append(plugin_instance)
+
+    ready: List[PluginInstanceRef] = [pi for pi, num in num_dependencies.items() if not num]
+    heapq.heapify(ready)
+    execution_order: List[PluginInstanceRef] = []
+
+    while ready:
+        plugin_instance = heapq.heappop(ready)
+        execution_order.append(plugin_instance)
+        for dependent in dependents[plugin_instance]:
+            num_dependencies[dependent] -= 1
+            if not num_dependencies[dependent]:
+                heapq.heappush(ready, dependent)
+
+    # If not all instances could be added to the execution order,
+    # the remaining instances have dependencies that can never be resolved.
+    if len(execution_order) < len(num_dependencies):
+        raise ValueError(
+            _get_dependency_cycle_message(
+                {pi for pi, num in num_dependencies.items() if num},
+            ),
+        )
 
     state._execution_order = execution_order
 
 
-def _resolve_instance_dependencies(
-    added_plugin_instances: Set[PluginInstanceRef],
-    execution_order: List[PluginInstanceRef],
-    plugin_name: str,
-    instance_name: str,
-    dependency_tree: Optional[List[PluginInstanceRef]] = None,
-) -> None:
+def _get_unresolved_dependency_message(
+    plugin_instance: PluginInstanceRef,
+    target_plugin_instance: PluginInstanceRef,
+) -> str:  # pragma: no cover
     """
-    Recursive depth-first search function for `resolve_instance_dependencies`.
+    Generate the error message for an instance reference to a plugin
+    that is not installed or not configured.
 
     Args:
-        added_plugin_instances (Set[PluginInstanceRef]): Structure to avoid re-evaluating branches.
-        execution_order (List[PluginInstanceRef]): Final data structure, appended to in-place.
-        plugin_name (str): Name of the plugin the current instance being evaluated is under.
-        instance_name (str): Name of the instance to evaluate dependencies for.
-        dependency_tree (List[PluginInstanceRef], optional): Tree used to find dependency cycles.
+        plugin_instance (PluginInstanceRef): Instance the reference is defined in.
+        target_plugin_instance (PluginInstanceRef): Instance being referenced.
 
-    Raises:
-        ValueError: When a plugin used in an instance reference is not installed
-        ValueError: When a plugin used in an instance reference is disabled or not configured
-        ValueError: When a dependency cycle is detected
+    Returns:
+        Error message
     """
 
-    if not dependency_tree:
-        dependency_tree = []
-
-    plugin_instance: PluginInstanceRef = (plugin_name, instance_name)
-
-    # NOTE: Due to similar checks being run in the instance configuration loading
-    # stage in the `InstanceReference` annotation, in practice the checks within this block
-    # will never actually be used. They are still defined here as well, just in case.
-    if plugin_name not in state.instance_configs:  # pragma: no cover
-        error_message = 'Unable to resolve instance dependency "'
-        try:
-            previous_pi = dependency_tree[-1]
-            error_message += f"{previous_pi[0]}.instances[{previous_pi[1]!r}] -> "
-        except IndexError:
-            # Shouldn't happen because dependency keys are generated from
-            # instance configuration, but handle it just in case.
-            pass
-        error_message += f'{plugin_name}.instances[{instance_name!r}]": '
-        if plugin_name not in state.plugins:
-            error_message += f"Plugin '{plugin_name}' not installed"
-        else:
-            error_message += f"Plugin '{plugin_name}' disabled, or no configuration defined for it"
-        raise ValueError(error_message)
-
-    if plugin_instance in dependency_tree:
-        raise ValueError(
-            (
-                "Detected dependency cycle in configuration for instance references:\n"
-                + "\n".join(
-                    f"  {i}. {pname}.instances[{iname!r}]"
-                    for i, (pname, iname) in enumerate([*dependency_tree, plugin_instance], 1)
-                )
-            ),
-        )
+    plugin_name, instance_name = plugin_instance
+    target_plugin, target_instance = target_plugin_instance
+    error_message = (
+        'Unable to resolve instance dependency "'
+        f"{plugin_name}.instances[{instance_name!r}] -> "
+        f'{target_plugin}.instances[{target_instance!r}]": '
+    )
+    if target_plugin not in state.plugins:
+        error_message += f"Plugin '{target_plugin}' not installed"
+    else:
+        error_message += f"Plugin '{target_plugin}' disabled, or no configuration defined for it"
+    return error_message
+
+
+def _get_dependency_cycle_message(unresolved: Set[PluginInstanceRef]) -> str:
+    """
+    Find a dependency cycle within the given instances, and generate an error message for it.
 
-    if plugin_instance in state._instance_dependencies:
-        for target_plugin_instance in sorted(state._instance_dependencies[plugin_instance]):
-            if target_plugin_instance not in added_plugin_instances:
-                target_plugin, target_instance = target_plugin_instance
-                _resolve_instance_dependencies(
-                    added_plugin_instances=added_plugin_instances,
-                    execution_order=execution_order,
-                    plugin_name=target_plugin,
-                    instance_name=target_instance,
-                    dependency_tree=[*dependency_tree, plugin_instance],
-                )
+    Every instance that could not be resolved depends on at least one other
+    unresolved instance, so following those dependencies will always lead to a cycle.
+
+    Args:
+        unresolved (Set[PluginInstanceRef]): Instances that could not be resolved.
+
+    Returns:
+        Error message
+    """
+
+    dependency_tree: List[PluginInstanceRef] = []
+    visited: Set[PluginInstanceRef] = set()
+    plugin_instance = min(unresolved)
+
+    while plugin_instance not in visited:
+        dependency_tree.append(plugin_instance)
+        visited.add(plugin_instance)
+        plugin_instance = min(
+            target_plugin_instance
+            for target_plugin_instance in state._instance_dependencies[plugin_instance]
+            if target_plugin_instance in unresolved
+        )
 
-    added_plugin_instances.add(plugin_instance)
-    execution_order.append(plugin_instance)
+    return "Detected dependency cycle in configuration for instance references:\n" + "\n".join(
+        f"  {i}. {pname}.instances[{iname!r}]"
+        for i, (pname, iname) in enumerate([*dependency_tree, plugin_instance], 1)
+    )
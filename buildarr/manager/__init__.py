@@ -257,14 +257,15 @@ def load_managers(use_plugins: Optional[Set[str]] = None) -> None:
 
     managers: Dict[str, ManagerPlugin] = {}
 
-    for plugin_name, plugin in state.plugins.items():
-        if use_plugins and plugin_name not in use_plugins:
-            continue
-        if plugin_name not in state.config.model_fields_set:
-            continue
+    # Only load managers for installed plugins that are configured in Buildarr.
+    plugin_names = state.plugins.keys() & state.config.model_fields_set
+    if use_plugins:
+        plugin_names &= use_plugins
+
+    for plugin_name in sorted(plugin_names):
         with state._with_context(plugin_name=plugin_name):
             logger.debug("Loading plugin manager")
-            managers[plugin_name] = plugin.manager()
+            managers[plugin_name] = state.plugins[plugin_name].manager()
             logger.debug("Finished loading plugin manager")
 
     state.managers = managers
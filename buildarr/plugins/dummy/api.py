@@ -75,7 +75,7 @@ def api_get(
     logger.debug("GET %s", url)
 
     if not session:
-        session = requests.Session()
+        session = requests.Session() if isinstance(secrets, str) else secrets.session
     res = session.get(
         url,
         headers={"X-Api-Key": host_api_key} if host_api_key else None,
@@ -132,7 +132,7 @@ def api_post(
     logger.debug("POST %s <- req=%s", url, repr(req))
 
     if not session:
-        session = requests.Session()
+        session = requests.Session() if isinstance(secrets, str) else secrets.session
     res = session.post(
         url,
         headers={"X-Api-Key": host_api_key} if host_api_key else None,
@@ -190,7 +190,7 @@ def api_put(
     logger.debug("PUT %s <- req=%s", url, repr(req))
 
     if not session:
-        session = requests.Session()
+        session = requests.Session() if isinstance(secrets, str) else secrets.session
     res = session.put(
         url,
         headers={"X-Api-Key": host_api_key} if host_api_key else None,
@@ -243,7 +243,7 @@ def api_delete(
     logger.debug("DELETE %s", url)
 
     if not session:
-        session = requests.Session()
+        session = requests.Session() if isinstance(secrets, str) else secrets.session
     res = session.delete(
         url,
         headers={"X-Api-Key": host_api_key} if host_api_key else None,
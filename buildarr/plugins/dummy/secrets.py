@@ -21,7 +21,9 @@ from __future__ import annotations
 from http import HTTPStatus
 from typing import TYPE_CHECKING, Optional
 
-from pydantic import field_validator
+import requests
+
+from pydantic import PrivateAttr, field_validator
 
 from buildarr.secrets import SecretsPlugin
 from buildarr.types import NonEmptyStr, Port
@@ -48,6 +50,20 @@ class DummySecrets(SecretsPlugin["DummyConfig"]):
     api_key: Optional[DummyApiKey]
     version: NonEmptyStr
 
+    _session: Optional[requests.Session] = PrivateAttr(default=None)
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        HTTP session used to send API requests to the Dummy instance.
+
+        The session is created on first use, and is reused for all API requests
+        made using this secrets object, so connections to the instance are kept alive.
+        """
+        if not self._session:
+            self._session = requests.Session()
+        return self._session
+
     @property
     def host_url(self) -> str:
         """
@@ -172,6 +188,14 @@ class DummySecrets(SecretsPlugin["DummyConfig"]):
             else:
                 raise
 
+    def close(self) -> None:
+        """
+        Close the HTTP session used to communicate with the instance, if one was created.
+        """
+        if self._session:
+            self._session.close()
+            self._session = None
+
     def test(self) -> bool:
         """
         Test whether or not the secrets metadata is valid for connecting to the instance.
@@ -65,7 +65,7 @@ def api_get(
     logger.debug("GET %s", url)
 
     if not session:
-        session = requests.Session()
+        session = requests.Session() if isinstance(secrets, str) else secrets.session
     res = session.get(url, timeout=state.request_timeout)
     try:
         res_json = res.json()
@@ -108,7 +108,7 @@ def api_post(
     logger.debug("POST %s <- req=%s", url, repr(req))
 
     if not session:
-        session = requests.Session()
+        session = requests.Session() if isinstance(secrets, str) else secrets.session
     res = session.post(
         url,
         timeout=state.request_timeout,
@@ -155,7 +155,7 @@ def api_put(
     logger.debug("PUT %s <- req=%s", url, repr(req))
 
     if not session:
-        session = requests.Session()
+        session = requests.Session() if isinstance(secrets, str) else secrets.session
     res = session.put(
         url,
         json=req,
@@ -197,7 +197,7 @@ def api_delete(
     logger.debug("DELETE %s", url)
 
     if not session:
-        session = requests.Session()
+        session = requests.Session() if isinstance(secrets, str) else secrets.session
     res = session.delete(url, timeout=state.request_timeout)
 
     logger.debug("DELETE %s -> status_code=%i", url, res.status_code)
@@ -21,7 +21,9 @@ from __future__ import annotations
 from http import HTTPStatus
 from typing import TYPE_CHECKING, Optional
 
-from pydantic import field_validator
+import requests
+
+from pydantic import PrivateAttr, field_validator
 
 from buildarr.secrets import SecretsPlugin
 from buildarr.types import NonEmptyStr, Port
@@ -56,6 +58,20 @@ class Dummy2Secrets(_Dummy2Secrets):
     url_base: Optional[str]
     version: NonEmptyStr
 
+    _session: Optional[requests.Session] = PrivateAttr(default=None)
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        HTTP session used to send API requests to the Dummy2 instance.
+
+        The session is created on first use, and is reused for all API requests
+        made using this secrets object, so connections to the instance are kept alive.
+        """
+        if not self._session:
+            self._session = requests.Session()
+        return self._session
+
     @property
     def host_url(self) -> str:
         """
@@ -161,6 +177,14 @@ class Dummy2Secrets(_Dummy2Secrets):
             version=initialize_json["version"],
         )
 
+    def close(self) -> None:
+        """
+        Close the HTTP session used to communicate with the instance, if one was created.
+        """
+        if self._session:
+            self._session.close()
+            self._session = None
+
     def test(self) -> bool:
         """
         Test whether or not the secrets metadata is valid for connecting to the instance.
@@ -99,3 +99,13 @@ class SecretsPlugin(SecretsBase[Config]):
             `True` if the test was successful, otherwise `False`
         """
         raise NotImplementedError()
+
+    def close(self) -> None:
+        """
+        Release any resources held by the secrets metadata object,
+        such as HTTP sessions used to communicate with the instance.
+
+        Buildarr calls this method once it has finished with the instance
+        in an update run. Implementing this method is optional.
+        """
+        pass
@@ -23,6 +23,7 @@ import os
 from collections import defaultdict
 from contextlib import contextmanager
 from pathlib import Path
+from threading import local
 from typing import TYPE_CHECKING, Tuple
 
 from buildarr.util import str_to_bool
@@ -46,6 +47,18 @@ The first string in the tuple is the plugin name, and the second string is the i
 """
 
 
+class _Context(local):
+    """
+    Plugin/instance context for the current thread.
+
+    This allows instances to be processed concurrently in separate threads,
+    each with their own context.
+    """
+
+    plugin: Optional[str] = None
+    instance: Optional[str] = None
+
+
 class State:
     """
     Active Buildarr state tracking class.
@@ -133,19 +146,38 @@ class State:
     This state attribute is internal, and shouldn't be accessed by plugins.
     """
 
-    _current_plugin: str
+    _context: _Context = _Context()
     """
-    The plugin being processed in the current context.
+    The plugin/instance context for the current thread.
 
     This state attribute is internal, and shouldn't be accessed by plugins.
     """
 
-    _current_instance: str
-    """
-    The current instance being processed in the current context.
+    @property
+    def _current_plugin(self) -> str:
+        """
+        The plugin being processed in the current context.
 
-    This state attribute is internal, and shouldn't be accessed by plugins.
-    """
+        This state attribute is internal, and shouldn't be accessed by plugins.
+        """
+        return self._context.plugin  # type: ignore[return-value]
+
+    @_current_plugin.setter
+    def _current_plugin(self, value: Optional[str]) -> None:
+        self._context.plugin = value
+
+    @property
+    def _current_instance(self) -> str:
+        """
+        The current instance being processed in the current context.
+
+        This state attribute is internal, and shouldn't be accessed by plugins.
+        """
+        return self._context.instance  # type: ignore[return-value]
+
+    @_current_instance.setter
+    def _current_instance(self, value: Optional[str]) -> None:
+        self._context.instance = value
 
     _instance_dependencies: DefaultDict[
         PluginInstanceRef,  # source_plugin_instance
@@ -20,12 +20,18 @@ from __future__ import annotations
 
 from logging import getLogger
 from shutil import move, rmtree
+from typing import TYPE_CHECKING
 from urllib.request import urlretrieve
 from zipfile import ZipFile
 
 from .state import state
 from .util import create_temp_dir, remove_dir
 
+if TYPE_CHECKING:
+    from typing import Set
+
+    from .state import PluginInstanceRef
+
 logger = getLogger(__name__)
 
 
@@ -47,6 +53,29 @@ def trash_metadata_used() -> bool:
     return False
 
 
+def get_trash_metadata_instances() -> Set[PluginInstanceRef]:
+    """
+    Read configuration for all loaded instances in the global state, and return
+    the instances that use TRaSH-Guides metadata.
+
+    Unlike `trash_metadata_used`, every instance configuration is checked,
+    so the result can be reused instead of checking instances again later.
+
+    Returns:
+        Plugin-instance references for instances that use TRaSH-Guides metadata
+    """
+
+    trash_metadata_instances: Set[PluginInstanceRef] = set()
+
+    for plugin_name in state.active_plugins:
+        for instance_name, instance_config in state.instance_configs[plugin_name].items():
+            with state._with_context(plugin_name=plugin_name, instance_name=instance_name):
+                if state.managers[plugin_name].uses_trash_metadata(instance_config):
+                    trash_metadata_instances.add((plugin_name, instance_name))
+
+    return trash_metadata_instances
+
+
 def fetch_trash_metadata() -> None:
     """
     Download the TRaSH-Guides metadata from the URL specified in the Buildarr config
@@ -18,6 +18,8 @@ Buildarr general purpose type hints, used in plugin models.
 
 from __future__ import annotations
 
+import sys
+
 from functools import total_ordering
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Mapping, Optional, Sequence, Type
@@ -548,7 +550,7 @@ def _instance_reference(plugin_name: str, instance_name: Optional[str]) -> Optio
 
     if state._current_plugin and state._current_instance:
         state._instance_dependencies[(state._current_plugin, state._current_instance)].add(
-            (plugin_name, instance_name),
+            (sys.intern(plugin_name), sys.intern(instance_name)),
         )
 
     return instance_name
@@ -21,13 +21,14 @@ from __future__ import annotations
 import os
 
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path, PurePosixPath, PureWindowsPath
 from shutil import rmtree
 from tempfile import TemporaryDirectory, mkdtemp
 from typing import TYPE_CHECKING, Mapping
 
 if TYPE_CHECKING:
-    from typing import Any, Dict, Generator, Union
+    from typing import IO, Any, Dict, Generator, Optional, Tuple, Type, Union
 
 
 __all__ = ["get_absolute_path", "merge_dicts"]
@@ -188,6 +189,7 @@ def remove_dir(path: os.PathLike, nonexist_ok: bool = True) -> None:
             raise
 
 
+@lru_cache(maxsize=1024)
 def windows_to_posix(path: os.PathLike) -> str:
     """
     Convert a given Windows path to the equivalent POSIX path, suitable for use in
@@ -196,6 +198,7 @@ def windows_to_posix(path: os.PathLike) -> str:
     If the given path is already POSIX compliant, it will be unmodified.
 
     Accepts both strings and path-like objects, but returns a string.
+    Results are cached, as the same paths are commonly converted many times.
 
     Args:
         path (path-like object): Path to convert to POSIX.
@@ -215,3 +218,60 @@ def windows_to_posix(path: os.PathLike) -> str:
         if windows_path.drive
         else windows_path.as_posix()
     )
+
+
+def yaml_safe_load(stream: Union[str, bytes, IO[Any]]) -> Any:
+    """
+    Parse the given YAML document, and return the resulting object.
+
+    This is equivalent to `yaml.safe_load`, but uses the LibYAML-based
+    C loader if PyYAML was built with it, as it is much faster.
+
+    Args:
+        stream (Union[str, bytes, IO[Any]]): YAML document, or file object to read it from.
+
+    Returns:
+        Parsed object
+    """
+
+    import yaml
+
+    return yaml.load(stream, Loader=_get_yaml_safe_classes()[0])  # noqa: S506
+
+
+def yaml_safe_dump(data: Any, stream: Optional[IO[Any]] = None, **kwargs) -> Any:
+    """
+    Serialise the given object into a YAML document.
+
+    This is equivalent to `yaml.safe_dump`, but uses the LibYAML-based
+    C dumper if PyYAML was built with it, as it is much faster.
+
+    Any additional parameters are passed to `yaml.dump`.
+
+    Args:
+        data (Any): Object to serialise.
+        stream (Optional[IO[Any]], optional): File object to write to. Defaults to `None`.
+
+    Returns:
+        YAML document string if `stream` is `None`, otherwise `None`
+    """
+
+    import yaml
+
+    return yaml.dump(data, stream, Dumper=_get_yaml_safe_classes()[1], **kwargs)
+
+
+@lru_cache(maxsize=None)
+def _get_yaml_safe_classes() -> Tuple[Type[Any], Type[Any]]:
+    # Return the safe YAML loader and dumper classes to use, preferring
+    # the LibYAML-based C implementations if PyYAML was built with them.
+    # PyYAML is slow to import, so it is only imported the first time
+    # a YAML document is loaded or dumped, instead of when this module is imported.
+    try:
+        from yaml import CSafeDumper as YAMLSafeDumper, CSafeLoader as YAMLSafeLoader
+    except ImportError:  # pragma: no cover
+        from yaml import (  # type: ignore[assignment]
+            SafeDumper as YAMLSafeDumper,
+            SafeLoader as YAMLSafeLoader,
+        )
+    return (YAMLSafeLoader, YAMLSafeDumper)
@@ -134,6 +134,22 @@ def test_hostname_is_ip_address(buildarr_yml_factory, buildarr_compose) -> None:
     )
 
 
+def test_hostname_is_ipv6_address(buildarr_yml_factory, buildarr_compose) -> None:
+    """
+    Check that IPv6 addresses are rejected as hostname definitions
+    when generating a Docker Compose file.
+    """
+
+    result = buildarr_compose(buildarr_yml_factory({"dummy": {"hostname": "2001:db8::1"}}))
+
+    assert result.returncode == 1
+    assert result.stderr.splitlines()[-1] == (
+        "buildarr.cli.exceptions.ComposeInvalidHostnameError: "
+        "Invalid hostname '2001:db8::1' for dummy instance 'default': "
+        "Expected hostname, got IP address"
+    )
+
+
 def test_hostname_is_localhost(buildarr_yml_factory, buildarr_compose) -> None:
     """
     Check that `localhost` is rejected as a hostname definition
@@ -458,3 +474,34 @@ def test_volumes_list_tuple_invalid(buildarr_yml_factory, buildarr_compose) -> N
         "(expecting a 2-tuple, or 3-tuple): "
         f"({str(buildarr_yml.parent)!r}, '/config', ['ro'], 'invalid')"
     )
+
+
+def test_volumes_order(buildarr_yml_factory, buildarr_compose) -> None:
+    """
+    Check that named volumes are output in the order they were first defined
+    when generating a Docker Compose file.
+    """
+
+    buildarr_yml = buildarr_yml_factory(
+        {
+            "dummy": {
+                "use_service_volumes": True,
+                "service_volumes_type": "dict",
+                "instances": {
+                    instance_name: {"hostname": f"dummy-{instance_name}"}
+                    for instance_name in ("c", "a", "d", "b")
+                },
+            },
+        },
+    )
+
+    result = buildarr_compose(buildarr_yml)
+
+    assert result.returncode == 0
+    assert result.stdout.splitlines()[-5:] == [
+        "volumes:",
+        "- dummy_a",
+        "- dummy_b",
+        "- dummy_c",
+        "- dummy_d",
+    ]
@@ -255,3 +255,65 @@ def test_ignore_hostnames(opt, buildarr_yml_factory, buildarr_compose) -> None:
         "    depends_on:",
         "    - dummy_default",
     ]
+
+
+def test_cache(tmp_path, buildarr_yml_factory, buildarr_compose) -> None:
+    """
+    Check that the parsed configuration file is cached in the cache directory
+    when the `--cache` option is set, and reused on subsequent runs.
+    """
+
+    buildarr_yml = buildarr_yml_factory({"dummy": {"hostname": "dummy"}})
+    cache_dir = tmp_path / "cache"
+
+    result_1 = buildarr_compose(buildarr_yml, "--cache", BUILDARR_CACHE_DIR=str(cache_dir))
+    result_2 = buildarr_compose(buildarr_yml, "--cache", BUILDARR_CACHE_DIR=str(cache_dir))
+
+    cache_jsons = list((cache_dir / "config").iterdir())
+
+    assert result_1.returncode == 0
+    assert result_2.returncode == 0
+    assert len(cache_jsons) == 1
+    assert cache_jsons[0].stat().st_mode & 0o777 == 0o600  # noqa: PLR2004
+    assert f"[DEBUG] Wrote configuration cache file '{cache_jsons[0]}'" in result_1.stderr
+    assert f"[DEBUG] Using cached configuration file '{cache_jsons[0]}'" in result_2.stderr
+    assert result_1.stdout == result_2.stdout
+    assert not list(buildarr_yml.parent.glob("*.cache.json"))
+
+
+def test_cache_modified(tmp_path, buildarr_yml_factory, buildarr_compose) -> None:
+    """
+    Check that the cached configuration is not used after the contents of
+    the configuration file have been modified, even if its size is unchanged.
+    """
+
+    buildarr_yml = buildarr_yml_factory({"dummy": {"hostname": "dummy1"}})
+    cache_dir = tmp_path / "cache"
+
+    buildarr_compose(buildarr_yml, "--cache", BUILDARR_CACHE_DIR=str(cache_dir))
+    buildarr_yml_factory({"dummy": {"hostname": "dummy2"}})
+    result = buildarr_compose(buildarr_yml, "--cache", BUILDARR_CACHE_DIR=str(cache_dir))
+
+    assert result.returncode == 0
+    assert "[DEBUG] Using cached configuration file" not in result.stderr
+    assert "    hostname: dummy2" in result.stdout.splitlines()
+
+
+@pytest.mark.parametrize("opt", [None, "--no-cache"])
+def test_no_cache(opt, tmp_path, buildarr_yml_factory, buildarr_compose) -> None:
+    """
+    Check that configuration files are not cached by default,
+    or when the `--no-cache` option is set.
+    """
+
+    buildarr_yml = buildarr_yml_factory({"dummy": {"hostname": "dummy"}})
+    cache_dir = tmp_path / "cache"
+
+    result = buildarr_compose(
+        buildarr_yml,
+        *([opt] if opt else []),
+        BUILDARR_CACHE_DIR=str(cache_dir),
+    )
+
+    assert result.returncode == 0
+    assert not cache_dir.exists()
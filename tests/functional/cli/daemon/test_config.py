@@ -27,7 +27,7 @@ from urllib.parse import urlparse
 
 import pytest
 
-from .util import next_hour
+from .util import modify_file, next_hour
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -358,7 +358,7 @@ def test_watch_config_enabled(
 
     child: spawn = buildarr_daemon_interactive(buildarr_yml)
     child.expect(r"\[INFO\] Buildarr ready.")
-    buildarr_yml.touch()
+    modify_file(buildarr_yml)
     child.expect(f"\\[INFO\\] Config file '{re.escape(str(buildarr_yml))}' has been modified")
     child.expect(r"\[INFO\] Reloading config")
     child.expect(r"\[INFO\] Finished reloading config")
@@ -369,6 +369,173 @@ def test_watch_config_enabled(
     assert child.exitstatus == 0
 
 
+def test_watch_config_polling(
+    httpserver: HTTPServer,
+    buildarr_yml_factory,
+    buildarr_daemon_interactive,
+) -> None:
+    """
+    Check that configuration file watching works when the
+    `buildarr.watch_config_polling` configuration attribute is enabled.
+    """
+
+    buildarr_yml: Path = buildarr_yml_factory(
+        {
+            "buildarr": {
+                "update_times": [next_hour()],
+                "watch_config": True,
+                "watch_config_polling": True,
+                "watch_config_interval": 0.5,
+            },
+            "dummy": {"hostname": "localhost", "port": urlparse(httpserver.url_for("")).port},
+        },
+    )
+
+    child: spawn = buildarr_daemon_interactive(buildarr_yml)
+    child.expect(r"\[INFO\] Enabling config file monitoring \(using polling\)")
+    child.expect(r"\[INFO\] Buildarr ready.")
+    modify_file(buildarr_yml)
+    child.expect(f"\\[INFO\\] Config file '{re.escape(str(buildarr_yml))}' has been modified")
+    child.expect(r"\[INFO\] Reloading config")
+    child.expect(r"\[INFO\] Finished reloading config")
+    child.expect(r"\[INFO\] Buildarr ready.")
+    child.terminate()
+    child.wait()
+
+    assert child.exitstatus == 0
+
+
+def test_watch_config_burst(
+    httpserver: HTTPServer,
+    buildarr_yml_factory,
+    buildarr_daemon_interactive,
+) -> None:
+    """
+    Check that multiple configuration file events received in quick succession
+    only cause the configuration to be reloaded once.
+    """
+
+    buildarr_yml: Path = buildarr_yml_factory(
+        {
+            "buildarr": {"update_times": [next_hour()], "watch_config": True},
+            "dummy": {"hostname": "localhost", "port": urlparse(httpserver.url_for("")).port},
+        },
+    )
+
+    child: spawn = buildarr_daemon_interactive(buildarr_yml)
+    child.expect(r"\[INFO\] Buildarr ready.")
+    for _ in range(3):
+        modify_file(buildarr_yml)
+    child.expect(r"\[INFO\] Reloading config")
+    child.expect(r"\[INFO\] Finished reloading config")
+    child.expect(r"\[INFO\] Buildarr ready.")
+    child.terminate()
+    child.wait()
+
+    output: str = child.logfile.getvalue().decode()
+
+    assert child.exitstatus == 0
+    assert output.count("[INFO] Reloading config") == 1
+
+
+def test_watch_config_replaced(
+    httpserver: HTTPServer,
+    buildarr_yml_factory,
+    buildarr_daemon_interactive,
+) -> None:
+    """
+    Check that the configuration is reloaded when a configuration file is replaced
+    by renaming another file over it, as done by editors that save files atomically.
+    """
+
+    buildarr_yml: Path = buildarr_yml_factory(
+        {
+            "buildarr": {"update_times": [next_hour()], "watch_config": True},
+            "dummy": {"hostname": "localhost", "port": urlparse(httpserver.url_for("")).port},
+        },
+    )
+    buildarr_yml_tmp = buildarr_yml.with_name(f".{buildarr_yml.name}.tmp")
+
+    child: spawn = buildarr_daemon_interactive(buildarr_yml)
+    child.expect(r"\[INFO\] Buildarr ready.")
+    buildarr_yml_tmp.write_text(f"{buildarr_yml.read_text()}\n")
+    buildarr_yml_tmp.replace(buildarr_yml)
+    child.expect(f"\\[INFO\\] Config file '{re.escape(str(buildarr_yml))}' has been replaced")
+    child.expect(r"\[INFO\] Reloading config")
+    child.expect(r"\[INFO\] Finished reloading config")
+    child.expect(r"\[INFO\] Buildarr ready.")
+    child.terminate()
+    child.wait()
+
+    assert child.exitstatus == 0
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="Requires inotify attribute events")
+def test_watch_config_unchanged(
+    httpserver: HTTPServer,
+    buildarr_yml_factory,
+    buildarr_daemon_interactive,
+) -> None:
+    """
+    Check that the configuration is not reloaded when a configuration file event is received,
+    but the configuration files have not been modified.
+    """
+
+    buildarr_yml: Path = buildarr_yml_factory(
+        {
+            "buildarr": {"update_times": [next_hour()], "watch_config": True},
+            "dummy": {"hostname": "localhost", "port": urlparse(httpserver.url_for("")).port},
+        },
+    )
+
+    child: spawn = buildarr_daemon_interactive(buildarr_yml)
+    child.expect(r"\[INFO\] Buildarr ready.")
+    # Changing the file mode generates an event without modifying the file.
+    buildarr_yml.chmod(buildarr_yml.stat().st_mode)
+    child.expect(f"\\[INFO\\] Config file '{re.escape(str(buildarr_yml))}' has been modified")
+    child.expect(r"\[INFO\] Config files are unchanged, skipping reload")
+    child.expect(r"\[INFO\] Buildarr ready.")
+    child.terminate()
+    child.wait()
+
+    output: str = child.logfile.getvalue().decode()
+
+    assert child.exitstatus == 0
+    assert "[INFO] Reloading config" not in output
+
+
+def test_watch_config_touched(
+    httpserver: HTTPServer,
+    buildarr_yml_factory,
+    buildarr_daemon_interactive,
+) -> None:
+    """
+    Check that the configuration is not reloaded when a configuration file is updated
+    without any changes being made to its contents.
+    """
+
+    buildarr_yml: Path = buildarr_yml_factory(
+        {
+            "buildarr": {"update_times": [next_hour()], "watch_config": True},
+            "dummy": {"hostname": "localhost", "port": urlparse(httpserver.url_for("")).port},
+        },
+    )
+
+    child: spawn = buildarr_daemon_interactive(buildarr_yml)
+    child.expect(r"\[INFO\] Buildarr ready.")
+    buildarr_yml.write_bytes(buildarr_yml.read_bytes())
+    child.expect(f"\\[INFO\\] Config file '{re.escape(str(buildarr_yml))}' has been modified")
+    child.expect(r"\[INFO\] Config files are unchanged, skipping reload")
+    child.expect(r"\[INFO\] Buildarr ready.")
+    child.terminate()
+    child.wait()
+
+    output: str = child.logfile.getvalue().decode()
+
+    assert child.exitstatus == 0
+    assert "[INFO] Reloading config" not in output
+
+
 def test_watch_config_disabled(
     httpserver: HTTPServer,
     buildarr_yml_factory,
@@ -388,7 +555,7 @@ def test_watch_config_disabled(
 
     child: spawn = buildarr_daemon_interactive(buildarr_yml)
     child.expect(r"\[INFO\] Buildarr ready.")
-    buildarr_yml.touch()
+    modify_file(buildarr_yml)
     child.terminate()
     child.wait()
 
@@ -439,7 +606,7 @@ def test_watch_config_multiple_files(
     child: spawn = buildarr_daemon_interactive(buildarr_yml)
     child.expect(r"\[INFO\] Buildarr ready.")
     for config_file in (buildarr_yml, dummy_yml):
-        config_file.touch()
+        modify_file(config_file)
         child.expect(f"\\[INFO\\] Config file '{re.escape(str(config_file))}' has been modified")
         child.expect(r"\[INFO\] Reloading config")
         child.expect(r"\[INFO\] Finished reloading config")
@@ -533,7 +700,77 @@ def test_watch_config_disabled_to_enabled(
     child.expect(r"\[INFO\] Enabling config file monitoring")
     child.expect(r"\[INFO\] Finished enabling config file monitoring")
     child.expect(r"\[INFO\] Buildarr ready.")
-    buildarr_yml.touch()
+    modify_file(buildarr_yml)
+    child.expect(r"\[INFO\] Reloading config")
+    child.expect(r"\[INFO\] Config file monitoring is already enabled")
+    child.expect(r"\[INFO\] Finished reloading config")
+    child.expect(r"\[INFO\] Buildarr ready.")
+    child.terminate()
+    child.wait()
+
+    assert child.exitstatus == 0
+
+
+def test_watch_config_includes_changed(
+    tmp_path: Path,
+    httpserver: HTTPServer,
+    buildarr_daemon_interactive,
+) -> None:
+    """
+    Check that configuration files added to `includes` while the daemon is running
+    are monitored after the configuration is reloaded.
+    """
+
+    buildarr_yml = tmp_path / "buildarr.yml"
+    dummy_yml = tmp_path / "dummy.yml"
+
+    with dummy_yml.open("w") as f:
+        f.write(
+            (
+                "---\n"
+                "dummy:\n"
+                "  hostname: localhost\n"
+                f"  port: {urlparse(httpserver.url_for('')).port}\n"
+            ),
+        )
+
+    with buildarr_yml.open("w") as f:
+        f.write(
+            (
+                "---\n"
+                "buildarr:\n"
+                "  update_times:\n"
+                f"    - '{next_hour()}'\n"
+                "  watch_config: true\n"
+                "dummy:\n"
+                "  hostname: localhost\n"
+                f"  port: {urlparse(httpserver.url_for('')).port}\n"
+            ),
+        )
+
+    child: spawn = buildarr_daemon_interactive(buildarr_yml)
+    child.expect(r"\[INFO\] Finished enabling config file monitoring")
+    child.expect(r"\[INFO\] Buildarr ready.")
+
+    with buildarr_yml.open("w") as f:
+        f.write(
+            (
+                "---\n"
+                "includes:\n"
+                "  - dummy.yml\n"
+                "buildarr:\n"
+                "  update_times:\n"
+                f"    - '{next_hour()}'\n"
+                "  watch_config: true\n"
+            ),
+        )
+
+    child.expect(r"\[INFO\] Reloading config")
+    child.expect(r"\[INFO\] Updating config file monitoring")
+    child.expect(r"\[INFO\] Finished updating config file monitoring")
+    child.expect(r"\[INFO\] Buildarr ready.")
+    modify_file(dummy_yml)
+    child.expect(f"\\[INFO\\] Config file '{re.escape(str(dummy_yml))}' has been modified")
     child.expect(r"\[INFO\] Reloading config")
     child.expect(r"\[INFO\] Config file monitoring is already enabled")
     child.expect(r"\[INFO\] Finished reloading config")
@@ -599,7 +836,7 @@ def test_watch_config_enabled_to_disabled(
     child.expect(r"\[INFO\] Finished reloading config")
     child.expect(r"\[INFO\] Buildarr ready.")
 
-    buildarr_yml.touch()
+    modify_file(buildarr_yml)
 
     # Do extra testing on non-Windows platforms to make sure this is working as expected.
     # Unfortunately we cannot do this on Windows because SIGHUP is not supported.
@@ -25,7 +25,7 @@ from urllib.parse import urlparse
 
 import pytest
 
-from .util import next_hour
+from .util import modify_file, next_hour
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -276,7 +276,7 @@ def test_watch(
 
     child: spawn = buildarr_daemon_interactive(buildarr_yml, opt)
     child.expect(r"\[INFO\] Buildarr ready.")
-    buildarr_yml.touch()
+    modify_file(buildarr_yml)
     child.expect(f"\\[INFO\\] Config file '{re.escape(str(buildarr_yml))}' has been modified")
     child.expect(r"\[INFO\] Reloading config")
     child.expect(r"\[INFO\] Finished reloading config")
@@ -307,7 +307,7 @@ def test_no_watch(
 
     child: spawn = buildarr_daemon_interactive(buildarr_yml, opt)
     child.expect(r"\[INFO\] Buildarr ready.")
-    buildarr_yml.touch()
+    modify_file(buildarr_yml)
     child.terminate()
     child.wait()
 
@@ -317,3 +317,52 @@ def test_no_watch(
     assert f"[INFO] Config file '{buildarr_yml}' has been modified" not in output
     assert "[INFO] Reloading config" not in output
     assert "[INFO] Finished reloading config" not in output
+
+
+def test_watch_interval(
+    httpserver: HTTPServer,
+    buildarr_yml_factory,
+    buildarr_daemon_interactive,
+) -> None:
+    """
+    Check that the `--watch-interval` option works properly.
+    """
+
+    buildarr_yml: Path = buildarr_yml_factory(
+        {
+            "buildarr": {
+                "update_times": [next_hour()],
+                "watch_config": True,
+                "watch_config_polling": True,
+                "watch_config_interval": 3600,
+            },
+            "dummy": {"hostname": "localhost", "port": urlparse(httpserver.url_for("")).port},
+        },
+    )
+
+    child: spawn = buildarr_daemon_interactive(buildarr_yml, "--watch-interval", "0.5")
+    child.expect(r"\[INFO\] Buildarr ready.")
+    modify_file(buildarr_yml)
+    child.expect(f"\\[INFO\\] Config file '{re.escape(str(buildarr_yml))}' has been modified")
+    child.expect(r"\[INFO\] Reloading config")
+    child.expect(r"\[INFO\] Finished reloading config")
+    child.expect(r"\[INFO\] Buildarr ready.")
+    child.terminate()
+    child.wait()
+
+    assert child.exitstatus == 0
+
+
+def test_watch_interval_invalid(buildarr_yml_factory, buildarr_daemon) -> None:
+    """
+    Check that the `--watch-interval` option rejects non-positive intervals.
+    """
+
+    result: CompletedProcess = buildarr_daemon(
+        buildarr_yml_factory({"dummy": {}}),
+        "--watch-interval",
+        "0",
+    )
+
+    assert result.returncode == 2  # noqa: PLR2004
+    assert "Invalid value for '--watch-interval'" in result.stderr
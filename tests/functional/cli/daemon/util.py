@@ -19,6 +19,10 @@ Helper functions for the `buildarr daemon` CLI command functional tests.
 from __future__ import annotations
 
 from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 def next_hour(hours: int = 1) -> str:
@@ -33,3 +37,16 @@ def next_hour(hours: int = 1) -> str:
     """
 
     return (datetime.now() + timedelta(hours=hours)).strftime("%H:%M")
+
+
+def modify_file(path: Path) -> None:
+    """
+    Make a change to the contents of the given configuration file,
+    without changing the configuration it defines.
+
+    Args:
+        path (Path): The file to modify.
+    """
+
+    with path.open("a") as f:
+        f.write("\n")
@@ -178,3 +178,60 @@ def test_plugin(
     assert (
         "[INFO] <dummy2> (default) Remote configuration successfully updated" not in result.stdout
     )
+
+
+@pytest.mark.parametrize("opt", [None, "--cache", "--no-cache"])
+def test_cache(
+    tmp_path,
+    httpserver: HTTPServer,
+    instance_value,
+    opt,
+    buildarr_yml_factory,
+    buildarr_run,
+) -> None:
+    """
+    Check that the parsed configuration file is only cached (and reused
+    on subsequent runs) when the `--cache` option is set.
+    """
+
+    api_root = "/api/v1"
+    version = "1.0.0"
+
+    httpserver.expect_request("/initialize.json", method="GET").respond_with_json(
+        {"apiRoot": api_root, "version": version},
+    )
+    httpserver.expect_request(f"{api_root}/status", method="GET").respond_with_json(
+        {"version": version},
+    )
+    httpserver.expect_request(f"{api_root}/settings", method="GET").respond_with_json(
+        {
+            "isUpdated": True,
+            "trashValue": None,
+            "trashValue2": None,
+            "instanceValue": instance_value,
+        },
+    )
+
+    buildarr_yml = buildarr_yml_factory(
+        {
+            "dummy": {
+                "hostname": "localhost",
+                "port": urlparse(httpserver.url_for("")).port,
+                "settings": {"instance_value": instance_value},
+            },
+        },
+    )
+    cache_dir = tmp_path / "cache"
+    opts = [opt] if opt else []
+
+    result_1 = buildarr_run(buildarr_yml, *opts, BUILDARR_CACHE_DIR=str(cache_dir))
+    result_2 = buildarr_run(buildarr_yml, *opts, BUILDARR_CACHE_DIR=str(cache_dir))
+
+    httpserver.check_assertions()
+    assert result_1.returncode == 0
+    assert result_2.returncode == 0
+    if opt == "--cache":
+        assert "[DEBUG] Wrote configuration cache file" in result_1.stderr
+        assert "[DEBUG] Using cached configuration file" in result_2.stderr
+    else:
+        assert not cache_dir.exists()
@@ -21,6 +21,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
+import pytest
+
 if TYPE_CHECKING:
     from pytest_httpserver import HTTPServer
 
@@ -206,7 +208,9 @@ def test_already_initialized(
     assert "[INFO] <dummy> (default) Remote configuration successfully updated" in result.stdout
 
 
+@pytest.mark.parametrize("max_concurrent_instances", [1, 2])
 def test_multiple_plugins(
+    max_concurrent_instances: int,
     httpserver: HTTPServer,
     instance_value,
     buildarr_yml_factory,
@@ -214,43 +218,52 @@ def test_multiple_plugins(
 ) -> None:
     """
     Check performing a single update run with multiple plugins configured.
+
+    When more than one instance can be processed at a time, requests made
+    to different instances concurrently may arrive in any order.
     """
 
+    expect_request = (
+        httpserver.expect_ordered_request
+        if max_concurrent_instances == 1
+        else httpserver.expect_oneshot_request
+    )
+
     api_root = "/api/v1"
     version = "1.0.0"
 
     # Check (and initialise) the dummy instance.
-    httpserver.expect_ordered_request("/dummy/initialize.json", method="GET").respond_with_json(
+    expect_request("/dummy/initialize.json", method="GET").respond_with_json(
         {"apiRoot": f"/dummy{api_root}", "initialized": False},
     )
-    httpserver.expect_ordered_request(f"/dummy{api_root}/init", method="POST").respond_with_json(
+    expect_request(f"/dummy{api_root}/init", method="POST").respond_with_json(
         {"initialized": True},
     )
 
     # Fetch API key (if available) from the dummy instance.
-    httpserver.expect_ordered_request("/dummy/initialize.json", method="GET").respond_with_json(
+    expect_request("/dummy/initialize.json", method="GET").respond_with_json(
         {"apiRoot": api_root, "version": version, "initialized": True},
     )
     # Get dummy instance status in the connection test.
-    httpserver.expect_ordered_request(f"/dummy{api_root}/status", method="GET").respond_with_json(
+    expect_request(f"/dummy{api_root}/status", method="GET").respond_with_json(
         {"version": version},
     )
 
     # Fetch dummy2 instance metadata in the connection test.
-    httpserver.expect_ordered_request("/dummy2/initialize.json", method="GET").respond_with_json(
+    expect_request("/dummy2/initialize.json", method="GET").respond_with_json(
         {"apiRoot": f"/dummy2{api_root}", "version": version},
     )
     # Get dummy2 instance status in the connection test.
-    httpserver.expect_ordered_request(f"/dummy2{api_root}/status", method="GET").respond_with_json(
+    expect_request(f"/dummy2{api_root}/status", method="GET").respond_with_json(
         {"version": version},
     )
 
     # Get dummy instance configuration for updating.
-    httpserver.expect_ordered_request(f"/dummy{api_root}/settings", method="GET").respond_with_json(
+    expect_request(f"/dummy{api_root}/settings", method="GET").respond_with_json(
         {"isUpdated": False, "trashValue": None, "trashValue2": None, "instanceValue": None},
     )
     # Update dummy instance configuration.
-    httpserver.expect_ordered_request(
+    expect_request(
         f"/dummy{api_root}/settings",
         method="POST",
         json={"trashValue": None, "trashValue2": None, "instanceValue": instance_value},
@@ -260,14 +273,14 @@ def test_multiple_plugins(
     )
 
     # Get dummy2 instance configuration for updating.
-    httpserver.expect_ordered_request(
+    expect_request(
         f"/dummy2{api_root}/settings",
         method="GET",
     ).respond_with_json(
         {"isUpdated": False, "instanceValue": None},
     )
     # Update dummy2 instance configuration.
-    httpserver.expect_ordered_request(
+    expect_request(
         f"/dummy2{api_root}/settings",
         method="POST",
         json={"instanceValue": instance_value},
@@ -277,7 +290,7 @@ def test_multiple_plugins(
     )
 
     # Get instance configuration for deleting dummy2 instance resources.
-    httpserver.expect_ordered_request(
+    expect_request(
         f"/dummy2{api_root}/settings",
         method="GET",
     ).respond_with_json(
@@ -285,7 +298,7 @@ def test_multiple_plugins(
     )
 
     # Get instance configuration for deleting dummy2 instance resources.
-    httpserver.expect_ordered_request(f"/dummy{api_root}/settings", method="GET").respond_with_json(
+    expect_request(f"/dummy{api_root}/settings", method="GET").respond_with_json(
         {
             "isUpdated": True,
             "trashValue": None,
@@ -297,6 +310,7 @@ def test_multiple_plugins(
     result = buildarr_run(
         buildarr_yml_factory(
             {
+                "buildarr": {"max_concurrent_instances": max_concurrent_instances},
                 "dummy": {
                     "hostname": "localhost",
                     "port": urlparse(httpserver.url_for("")).port,
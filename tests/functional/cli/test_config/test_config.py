@@ -25,6 +25,8 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 from zipfile import ZipFile
 
+import yaml
+
 if TYPE_CHECKING:
     from pathlib import Path
 
@@ -49,7 +51,12 @@ def test_invalid_config_file(tmp_path, buildarr_test_config) -> None:
     assert result.stderr.splitlines()[-4:] == [
         "yaml.scanner.ScannerError: while scanning a directive",
         f'  in "{buildarr_yml}", line 1, column 1',
-        "expected alphabetic or numeric character, but found '\\x00'",
+        (
+            # The LibYAML-based C loader is used if PyYAML was built with it.
+            "could not find expected directive name"
+            if yaml.__with_libyaml__
+            else "expected alphabetic or numeric character, but found '\\x00'"
+        ),
         f'  in "{buildarr_yml}", line 1, column 2',
     ]
 
@@ -120,6 +127,37 @@ def test_instance_dependency_multiple(buildarr_yml_factory, buildarr_test_config
     assert result.stdout.splitlines()[-1].endswith("[INFO] Configuration test successful.")
 
 
+def test_instance_dependency_reverse_order(buildarr_yml_factory, buildarr_test_config) -> None:
+    """
+    Check that each instance is only added to the execution order once,
+    when an instance depends on an instance that sorts after it.
+    """
+
+    buildarr_yml = buildarr_yml_factory(
+        {
+            "dummy": {
+                "hostname": "localhost",
+                "instances": {
+                    "dummy1": {"port": 9997, "settings": {"instance_name": "dummy3"}},
+                    "dummy2": {"port": 9998, "settings": {"instance_name": "dummy1"}},
+                    "dummy3": {"port": 9999},
+                },
+            },
+        },
+    )
+
+    result = buildarr_test_config(buildarr_yml)
+
+    assert result.returncode == 0
+    assert "[DEBUG] Execution order:" in result.stderr
+    assert "[DEBUG]   1. dummy.instances['dummy3']" in result.stderr
+    assert "[DEBUG]   2. dummy.instances['dummy1']" in result.stderr
+    assert "[DEBUG]   3. dummy.instances['dummy2']" in result.stderr
+    assert "[DEBUG]   4. " not in result.stderr
+    assert "[INFO] Resolving instance dependencies: PASSED" in result.stdout
+    assert result.stdout.splitlines()[-1].endswith("[INFO] Configuration test successful.")
+
+
 def test_instance_dependency_cycle(buildarr_yml_factory, buildarr_test_config) -> None:
     """
     Check that an error is returned when an instance dependency cycle is found.